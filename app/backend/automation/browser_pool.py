@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+from playwright.sync_api import Browser, BrowserContext, sync_playwright
+
+from ..config import CONFIG
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SHUTDOWN_TIMEOUT_S = 30.0
+
+# Playwright's sync API is bound to the thread that started it, and callers (anyio
+# worker threads, test executors) come and go. Browser work therefore runs on a small set
+# of long-lived threads fed by one queue; each owns its driver and browsers, which never
+# change threads, and concurrent requests still fill in parallel up to the pool size.
+_LOCK = threading.Lock()
+_THREADS: List[threading.Thread] = []
+_JOBS: Optional["queue.Queue[Optional[Tuple[Callable[[], object], Future]]]"] = None
+_LOCAL = threading.local()
+
+
+class _BrowserPool:
+    def __init__(self) -> None:
+        self.playwright = sync_playwright().start()
+        self.browsers: Dict[Tuple[bool, int], Browser] = {}
+
+    def browser(self, headless: bool, slow_mo_ms: int) -> Browser:
+        key = (headless, slow_mo_ms)
+        browser = self.browsers.get(key)
+        if browser is None or not browser.is_connected():
+            browser = self.playwright.chromium.launch(headless=headless, slow_mo=slow_mo_ms)
+            self.browsers[key] = browser
+        return browser
+
+    def close(self) -> None:
+        for browser in self.browsers.values():
+            try:
+                browser.close()
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.debug("Browser close failed: %s", exc)
+        self.browsers.clear()
+        try:
+            self.playwright.stop()
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.debug("Playwright stop failed: %s", exc)
+
+
+def _worker(jobs: "queue.Queue[Optional[Tuple[Callable[[], object], Future]]]") -> None:
+    _LOCAL.on_browser_thread = True
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        fn, future = job
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn())
+        except BaseException as exc:  # noqa: BLE001
+            future.set_exception(exc)
+    pool = getattr(_LOCAL, "pool", None)
+    if pool is not None:
+        pool.close()
+
+
+def _on_browser_thread() -> bool:
+    return getattr(_LOCAL, "on_browser_thread", False)
+
+
+def _pool() -> _BrowserPool:
+    if not _on_browser_thread():
+        raise RuntimeError("Playwright objects must be used inside browser_pool.run()")
+    pool = getattr(_LOCAL, "pool", None)
+    if pool is None:
+        pool = _LOCAL.pool = _BrowserPool()
+    return pool
+
+
+def run(fn: Callable[[], T]) -> T:
+    """Run ``fn`` on a free browser thread and return its result."""
+    if _on_browser_thread():
+        return fn()
+    global _JOBS
+    future: Future = Future()
+    with _LOCK:
+        if _JOBS is None:
+            # Drivers start lazily on a thread's first job, so idle workers cost only a blocked thread.
+            _JOBS = queue.Queue()
+            for index in range(CONFIG.autofill.browser_workers):
+                thread = threading.Thread(target=_worker, args=(_JOBS,), name=f"playwright-{index}", daemon=True)
+                thread.start()
+                _THREADS.append(thread)
+        _JOBS.put((fn, future))
+    return future.result()
+
+
+def get_context(headless: bool = True, slow_mo_ms: int = 0) -> BrowserContext:
+    """Return a fresh context on the warm browser. Call inside ``run``; callers must close it."""
+    return _pool().browser(headless, slow_mo_ms).new_context()
+
+
+def warm(headless: bool = True, slow_mo_ms: int = 0) -> None:
+    run(lambda: _pool().browser(headless, slow_mo_ms))
+
+
+def shutdown() -> None:
+    """Close each thread's browsers on that thread and stop them; the next ``run`` starts afresh."""
+    global _JOBS
+    with _LOCK:
+        threads, jobs = list(_THREADS), _JOBS
+        _THREADS.clear()
+        _JOBS = None
+        if jobs is None:
+            return
+        for _ in threads:
+            jobs.put(None)
+    if _on_browser_thread():
+        return
+    for thread in threads:
+        thread.join(SHUTDOWN_TIMEOUT_S)
+        if thread.is_alive():
+            LOGGER.warning("Playwright thread %s did not stop within %.0fs", thread.name, SHUTDOWN_TIMEOUT_S)
+
+
+def _forget_parent_pool() -> None:
+    # A forked child has no copies of the browser threads; start fresh.
+    global _LOCK, _JOBS
+    _LOCK = threading.Lock()
+    _THREADS.clear()
+    _JOBS = None
+
+
+atexit.register(shutdown)
+os.register_at_fork(after_in_child=_forget_parent_pool)
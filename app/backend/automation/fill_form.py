@@ -12,6 +12,7 @@ from typing import Dict, List, Optional, Tuple
 
 from playwright.sync_api import sync_playwright
 
+from . import browser_pool
 from ..field_registry import iter_autofill_fields
 from ..config import CONFIG, resolve_form_url
 from ..pipeline.normalize import normalize_date
@@ -854,13 +855,12 @@ def fill_form(
         f"Form URL: {target_url} | headless={headless} | slow_mo_ms={slow_mo_ms} | keep_open_ms={keep_open_ms}",
     )
 
-    def _run(playwright):
+    def _run(context):
         nonlocal final_url
-        browser = playwright.chromium.launch(headless=headless, slow_mo=slow_mo_ms)
-        context = browser.new_context()
-        context.tracing.start(screenshots=True, snapshots=True, sources=True)
-        page = context.new_page()
         try:
+            # Inside the try so a failed trace start still releases the (possibly pooled) context.
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            page = context.new_page()
             page.set_default_timeout(15000)
             page.goto(target_url, wait_until="domcontentloaded", timeout=45000)
             try:
@@ -1122,12 +1122,14 @@ def fill_form(
                 LOGGER.warning("Trace capture failed: %s", exc)
             if not keep_open:
                 context.close()
-                browser.close()
-        return browser, context, page
+        return page
 
     if keep_open:
+        # The consent window outlives this call, so it gets its own driver on the caller's thread.
         playwright = sync_playwright().start()
-        browser, context, page = _run(playwright)
+        browser = playwright.chromium.launch(headless=headless, slow_mo=slow_mo_ms)
+        context = browser.new_context()
+        page = _run(context)
         OPEN_BROWSER_SESSIONS.append(
             {
                 "run_dir": str(run_dir),
@@ -1138,9 +1140,16 @@ def fill_form(
             }
         )
         _append_run_log(run_dir, "Browser kept open for manual consent (keep_open_ms<0)")
-    else:
+    elif keep_open_ms > 0 and not headless:
+        # A timed headful session would park a pooled worker for keep_open_ms; keep it off the pool.
         with sync_playwright() as playwright:
-            _run(playwright)
+            browser = playwright.chromium.launch(headless=headless, slow_mo=slow_mo_ms)
+            try:
+                _run(browser.new_context())
+            finally:
+                browser.close()
+    else:
+        browser_pool.run(lambda: _run(browser_pool.get_context(headless=headless, slow_mo_ms=slow_mo_ms)))
 
     if fill_failures:
         reason_counts = Counter(fill_failures.values())
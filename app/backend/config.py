@@ -39,6 +39,8 @@ class AutofillConfig:
     slow_mo_ms: int = int(os.getenv("ALMA_AUTOFILL_SLOW_MO_MS", "0"))
     # Negative keeps the browser open indefinitely for manual consent.
     keep_open_ms: int = int(os.getenv("ALMA_AUTOFILL_KEEP_OPEN_MS", "-1"))
+    # Threads that each own a Playwright driver + warm browser for headless fills.
+    browser_workers: int = max(1, int(os.getenv("ALMA_AUTOFILL_BROWSER_WORKERS", "4")))
     form_url: str = "https://mendrika-alma.github.io/form-submission/"
 
 
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import requests
+
+# Shared keep-alive session so repeated fixture downloads in one process reuse the connection.
+_SESSION = requests.Session()
+
+
+def fetch_to(url: str, path: Path, timeout: float = 30) -> Path:
+    """Stream ``url`` into ``path``; the file only appears once the download has completed."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as fh, _SESSION.get(url, stream=True, timeout=timeout) as resp:
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            shutil.copyfileobj(resp.raw, fh)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return path
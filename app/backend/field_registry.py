@@ -1,16 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AutofillSpec:
     labels: List[str]
     order: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldSpec:
     key: str
     group: str
@@ -573,18 +573,24 @@ FIELDS: List[FieldSpec] = [
 
 FIELD_REGISTRY: Dict[str, FieldSpec] = {field.key: field for field in FIELDS}
 FIELD_ORDER: List[str] = [field.key for field in FIELDS]
+FIELD_KEYS: FrozenSet[str] = frozenset(FIELD_REGISTRY)
+
+# The registry is static, so the filtered views are built once at import.
+_FROZEN_FIELDS: Tuple[FieldSpec, ...] = tuple(FIELDS)
+_VALIDATION_FIELDS: Tuple[FieldSpec, ...] = tuple(field for field in FIELDS if field.validate)
+_AUTOFILL_FIELDS: Tuple[FieldSpec, ...] = tuple(field for field in FIELDS if field.autofill)
 
 
 def iter_fields() -> Iterable[FieldSpec]:
-    return FIELDS
+    return _FROZEN_FIELDS
 
 
 def iter_validation_fields() -> Iterable[FieldSpec]:
-    return [field for field in FIELDS if field.validate]
+    return _VALIDATION_FIELDS
 
 
 def iter_autofill_fields() -> Iterable[FieldSpec]:
-    return [field for field in FIELDS if field.autofill]
+    return _AUTOFILL_FIELDS
 
 
 def get_field_spec(key: str) -> Optional[FieldSpec]:
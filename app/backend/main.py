@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 import re
 import shutil
@@ -11,9 +10,10 @@ from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 import anyio
+import orjson
 from fastapi import FastAPI, File, Form, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from .automation.fill_form import fill_form
 from .config import CONFIG
@@ -67,7 +67,7 @@ MRZ_PRESENCE_FIELDS = {
     "passport.country_of_issue",
 }
 
-app = FastAPI(title="Doc Extractor")
+app = FastAPI(title="Doc Extractor", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -121,8 +121,7 @@ def _read_text_artifact(run_dir: Path, filename: str) -> str:
 
 def _write_json_artifact(run_dir: Path, filename: str, payload: Dict) -> None:
     path = run_dir / filename
-    with path.open("w") as f:
-        json.dump(payload, f, indent=2)
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
 
 def _doc_artifact_dir(run_dir: Path, doc_type: str) -> Path:
@@ -250,12 +249,20 @@ def _find_input_document(run_dir: Path) -> Optional[Path]:
     return sorted(files)[0]
 
 
+def _load_ocr_text(run_dir: Path) -> Optional[str]:
+    ocr_path = run_dir / "ocr_text.txt"
+    if not ocr_path.exists():
+        return None
+    return ocr_path.read_text()
+
+
 def _load_or_create_ocr_text(
     run_dir: Path, doc_path: Optional[Path], ocr_langs: Optional[str] = None
 ) -> str:
-    ocr_path = run_dir / "ocr_text.txt"
-    if ocr_path.exists() and not ocr_langs:
-        return ocr_path.read_text()
+    if not ocr_langs:
+        cached = _load_ocr_text(run_dir)
+        if cached is not None:
+            return cached
     if not doc_path:
         doc_path = _find_input_document(run_dir)
     if not doc_path:
@@ -1079,8 +1086,16 @@ def _apply_llm_corrections(
 
 def _write_result(run_dir: Path, result: ExtractionResult) -> None:
     out_path = run_dir / "extracted.json"
-    with out_path.open("w") as f:
-        json.dump(result.model_dump(), f, indent=2)
+    out_path.write_text(result.model_dump_json(indent=2))
+
+
+def _load_result(run_dir: Path, result_payload: Optional[Dict]) -> Optional[ExtractionResult]:
+    if result_payload:
+        return ExtractionResult.model_validate(result_payload)
+    extracted_path = run_dir / "extracted.json"
+    if not extracted_path.exists():
+        return None
+    return ExtractionResult.model_validate_json(extracted_path.read_bytes())
 
 
 @app.post("/extract")
@@ -1154,7 +1169,7 @@ async def extract(
     _write_result(run_dir, result)
     _log_run(run_dir, "Extraction complete")
 
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "run_id": run_dir.name,
             "result": result.model_dump(),
@@ -1166,26 +1181,21 @@ async def extract(
 @app.post("/review")
 async def review(payload: Dict):
     if not isinstance(payload, dict):
-        return JSONResponse({"error": "Invalid payload"}, status_code=400)
+        return ORJSONResponse({"error": "Invalid payload"}, status_code=400)
     run_id = payload.get("run_id")
     if not run_id:
-        return JSONResponse({"error": "Missing run_id"}, status_code=400)
+        return ORJSONResponse({"error": "Missing run_id"}, status_code=400)
     run_dir = RUNS_DIR / str(run_id)
     if not run_dir.exists():
-        return JSONResponse({"error": "Run not found"}, status_code=404)
+        return ORJSONResponse({"error": "Run not found"}, status_code=404)
     run_dir.mkdir(parents=True, exist_ok=True)
     (run_dir / "inputs").mkdir(exist_ok=True)
     _log_run(run_dir, "Starting review (pre-autofill)")
 
-    result_payload = payload.get("result") if isinstance(payload, dict) else None
-    if not result_payload:
-        extracted_path = run_dir / "extracted.json"
-        if extracted_path.exists():
-            result_payload = json.loads(extracted_path.read_text())
-    if not result_payload:
-        return JSONResponse({"error": "Missing extracted result"}, status_code=400)
+    result = _load_result(run_dir, payload.get("result") if isinstance(payload, dict) else None)
+    if result is None:
+        return ORJSONResponse({"error": "Missing extracted result"}, status_code=400)
 
-    result = ExtractionResult.model_validate(result_payload)
     passport_text = _read_text_artifact(run_dir, "passport_ocr.txt")
     g28_text = _read_text_artifact(run_dir, "g28_ocr.txt")
     review_report, llm_error, updated = validate_post_autofill(
@@ -1214,52 +1224,47 @@ async def review(payload: Dict):
     autofill_path = run_dir / "autofill_summary.json"
     validation_path = run_dir / "post_autofill_validation.json"
     if autofill_path.exists():
-        autofill_report = json.loads(autofill_path.read_text())
+        autofill_report = orjson.loads(autofill_path.read_bytes())
     if validation_path.exists():
-        validation_report = json.loads(validation_path.read_text())
+        validation_report = orjson.loads(validation_path.read_bytes())
     _write_final_snapshot(run_dir, run_id, updated, autofill_report, validation_report)
 
     _log_run(
         run_dir,
         f"Review summary: ready={summary.get('ready_for_autofill')} blocking={summary.get('blocking')}",
     )
-    return JSONResponse({"run_id": run_id, "result": updated.model_dump(), "review": review_payload})
+    return ORJSONResponse({"run_id": run_id, "result": updated.model_dump(), "review": review_payload})
 
 
 @app.post("/approve_canonical")
 async def approve_canonical(payload: Dict):
     if not isinstance(payload, dict):
-        return JSONResponse({"error": "Invalid payload"}, status_code=400)
+        return ORJSONResponse({"error": "Invalid payload"}, status_code=400)
     run_id = payload.get("run_id")
     if not run_id:
-        return JSONResponse({"error": "Missing run_id"}, status_code=400)
+        return ORJSONResponse({"error": "Missing run_id"}, status_code=400)
     run_dir = RUNS_DIR / str(run_id)
     if not run_dir.exists():
-        return JSONResponse({"error": "Run not found"}, status_code=404)
+        return ORJSONResponse({"error": "Run not found"}, status_code=404)
     run_dir.mkdir(parents=True, exist_ok=True)
     (run_dir / "inputs").mkdir(exist_ok=True)
 
-    result_payload = payload.get("result") if isinstance(payload, dict) else None
-    if not result_payload:
-        extracted_path = run_dir / "extracted.json"
-        if extracted_path.exists():
-            result_payload = json.loads(extracted_path.read_text())
-    if not result_payload:
-        return JSONResponse({"error": "Missing extracted result"}, status_code=400)
+    result = _load_result(run_dir, payload.get("result") if isinstance(payload, dict) else None)
+    if result is None:
+        return ORJSONResponse({"error": "Missing extracted result"}, status_code=400)
 
     review_summary = payload.get("review_summary") if isinstance(payload, dict) else None
     if not review_summary:
         summary_path = run_dir / "review_summary.json"
         if summary_path.exists():
-            review_summary = json.loads(summary_path.read_text())
+            review_summary = orjson.loads(summary_path.read_bytes())
     if not review_summary:
-        return JSONResponse({"error": "Missing review summary. Run /review first."}, status_code=400)
+        return ORJSONResponse({"error": "Missing review summary. Run /review first."}, status_code=400)
     if not review_summary.get("ready_for_autofill"):
-        return JSONResponse({"error": "Blocking issues remain. Resolve before autofill."}, status_code=400)
+        return ORJSONResponse({"error": "Blocking issues remain. Resolve before autofill."}, status_code=400)
 
-    result = ExtractionResult.model_validate(result_payload)
     if not result.meta.resolved_fields:
-        return JSONResponse({"error": "Missing resolved fields. Run /review first."}, status_code=400)
+        return ORJSONResponse({"error": "Missing resolved fields. Run /review first."}, status_code=400)
 
     now_iso = datetime.utcnow().isoformat()
     for entry in result.meta.resolved_fields.values():
@@ -1285,13 +1290,13 @@ async def approve_canonical(payload: Dict):
     autofill_path = run_dir / "autofill_summary.json"
     validation_path = run_dir / "post_autofill_validation.json"
     if autofill_path.exists():
-        autofill_report = json.loads(autofill_path.read_text())
+        autofill_report = orjson.loads(autofill_path.read_bytes())
     if validation_path.exists():
-        validation_report = json.loads(validation_path.read_text())
+        validation_report = orjson.loads(validation_path.read_bytes())
     _write_final_snapshot(run_dir, run_id, result, autofill_report, validation_report)
 
     _log_run(run_dir, "Canonical fields approved")
-    return JSONResponse({"run_id": run_id, "canonical": canonical_payload, "result": result.model_dump()})
+    return ORJSONResponse({"run_id": run_id, "canonical": canonical_payload, "result": result.model_dump()})
 
 
 @app.post("/detect_language")
@@ -1316,18 +1321,18 @@ async def detect_language_endpoint(
         ocr_text = _load_or_create_ocr_text(run_dir, doc_path, ocr_langs=ocr_langs)
     except Exception as exc:  # noqa: BLE001
         _log_run(run_dir, f"Language detection OCR failed: {exc}")
-        return JSONResponse({"run_id": run_dir.name, "error": f"OCR failed: {exc}"}, status_code=400)
+        return ORJSONResponse({"run_id": run_dir.name, "error": f"OCR failed: {exc}"}, status_code=400)
     if not ocr_text.strip():
         if not doc_path:
             _log_run(run_dir, "Language detection failed: missing document")
-            return JSONResponse({"run_id": run_dir.name, "error": "Missing document upload"}, status_code=400)
+            return ORJSONResponse({"run_id": run_dir.name, "error": "Missing document upload"}, status_code=400)
         _log_run(run_dir, "Language detection failed: empty OCR text")
-        return JSONResponse({"run_id": run_dir.name, "error": "OCR text empty"}, status_code=400)
+        return ORJSONResponse({"run_id": run_dir.name, "error": "OCR text empty"}, status_code=400)
 
     resolved_doc_type = infer_doc_type(doc_type, doc_path.name if doc_path else None, run_dir)
     if not resolved_doc_type:
         _log_run(run_dir, "Language detection failed: doc_type missing")
-        return JSONResponse({"run_id": run_dir.name, "error": "Missing doc_type (g28 or passport)"}, status_code=400)
+        return ORJSONResponse({"run_id": run_dir.name, "error": "Missing doc_type (g28 or passport)"}, status_code=400)
 
     language_meta, response_payload = _detect_language_payload(ocr_text)
     _write_language_artifact(run_dir, response_payload)
@@ -1345,7 +1350,7 @@ async def detect_language_endpoint(
         run_dir,
         f"Detected language: {response_payload['detected_language']} ({response_payload['language_confidence']})",
     )
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "run_id": run_dir.name,
             "doc_type": resolved_doc_type,
@@ -1381,18 +1386,18 @@ async def translate(
         ocr_text = _load_or_create_ocr_text(run_dir, doc_path, ocr_langs=ocr_langs)
     except Exception as exc:  # noqa: BLE001
         _log_run(run_dir, f"Translation OCR failed: {exc}")
-        return JSONResponse({"run_id": run_dir.name, "error": f"OCR failed: {exc}"}, status_code=400)
+        return ORJSONResponse({"run_id": run_dir.name, "error": f"OCR failed: {exc}"}, status_code=400)
     if not ocr_text.strip():
         if not doc_path:
             _log_run(run_dir, "Translation failed: missing document")
-            return JSONResponse({"run_id": run_dir.name, "error": "Missing document upload"}, status_code=400)
+            return ORJSONResponse({"run_id": run_dir.name, "error": "Missing document upload"}, status_code=400)
         _log_run(run_dir, "Translation failed: empty OCR text")
-        return JSONResponse({"run_id": run_dir.name, "error": "OCR text empty"}, status_code=400)
+        return ORJSONResponse({"run_id": run_dir.name, "error": "OCR text empty"}, status_code=400)
 
     resolved_doc_type = infer_doc_type(doc_type, doc_path.name if doc_path else None, run_dir)
     if not resolved_doc_type:
         _log_run(run_dir, "Translation failed: doc_type missing")
-        return JSONResponse({"run_id": run_dir.name, "error": "Missing doc_type (g28 or passport)"}, status_code=400)
+        return ORJSONResponse({"run_id": run_dir.name, "error": "Missing doc_type (g28 or passport)"}, status_code=400)
 
     language_meta, response_payload = _detect_language_payload(ocr_text)
     _write_language_artifact(run_dir, response_payload)
@@ -1408,7 +1413,7 @@ async def translate(
     translated_text, error = translate_text(ocr_text)
     if error:
         _log_run(run_dir, f"Translation failed: {error}")
-        return JSONResponse({"run_id": run_dir.name, "error": error}, status_code=400)
+        return ORJSONResponse({"run_id": run_dir.name, "error": error}, status_code=400)
 
     _write_text_artifact(run_dir, "translated_text.txt", translated_text)
     translated_payload = {
@@ -1442,7 +1447,7 @@ async def translate(
         "translated_ocr": f"runs/{run_dir.name}/translated_ocr.json",
         "text_artifact": f"runs/{run_dir.name}/doc_artifacts/{resolved_doc_type}/text_artifact.json",
     }
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "run_id": run_dir.name,
             "doc_type": resolved_doc_type,
@@ -1463,20 +1468,20 @@ async def set_text_artifact_active(
 ):
     run_dir = RUNS_DIR / run_id
     if not run_dir.exists():
-        return JSONResponse({"run_id": run_id, "error": "Run not found"}, status_code=404)
+        return ORJSONResponse({"run_id": run_id, "error": "Run not found"}, status_code=404)
 
     resolved_doc_type = infer_doc_type(doc_type, None, run_dir)
     if not resolved_doc_type:
-        return JSONResponse({"run_id": run_id, "error": "Missing doc_type (g28 or passport)"}, status_code=400)
+        return ORJSONResponse({"run_id": run_id, "error": "Missing doc_type (g28 or passport)"}, status_code=400)
 
     artifact = read_text_artifact(run_dir, resolved_doc_type)
     if not artifact:
-        return JSONResponse({"run_id": run_id, "error": "text_artifact.json not found"}, status_code=404)
+        return ORJSONResponse({"run_id": run_id, "error": "text_artifact.json not found"}, status_code=404)
 
     if active not in {"raw", "translated_en"}:
-        return JSONResponse({"run_id": run_id, "error": "active must be raw or translated_en"}, status_code=400)
+        return ORJSONResponse({"run_id": run_id, "error": "active must be raw or translated_en"}, status_code=400)
     if active == "translated_en" and not artifact.get("text", {}).get("translated_en"):
-        return JSONResponse({"run_id": run_id, "error": "No translated text available"}, status_code=400)
+        return ORJSONResponse({"run_id": run_id, "error": "No translated text available"}, status_code=400)
 
     updated = upsert_text_artifact(
         run_dir,
@@ -1491,7 +1496,7 @@ async def set_text_artifact_active(
         translation_engine=artifact.get("meta", {}).get("translation_engine"),
     )
     _log_run(run_dir, f"Text artifact active set to {active} for {resolved_doc_type}")
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "run_id": run_id,
             "doc_type": resolved_doc_type,
@@ -1504,7 +1509,7 @@ async def set_text_artifact_active(
 @app.post("/autofill")
 async def autofill(payload: Dict):
     if not isinstance(payload, dict):
-        return JSONResponse({"error": "Invalid payload"}, status_code=400)
+        return ORJSONResponse({"error": "Invalid payload"}, status_code=400)
     run_id = payload.get("run_id")
     force = bool(payload.get("force"))
     if run_id:
@@ -1521,13 +1526,9 @@ async def autofill(payload: Dict):
         payload_dict.pop("_autofill", None)
         payload_dict.pop("force", None)
 
-        result_payload = payload_dict if payload_dict else None
-        if not result_payload and run_id:
-            extracted_path = run_dir / "extracted.json"
-            if extracted_path.exists():
-                result_payload = json.loads(extracted_path.read_text())
-        if not result_payload:
-            return JSONResponse(
+        result = _load_result(run_dir, payload_dict if payload_dict else None)
+        if result is None:
+            return ORJSONResponse(
                 {
                     "run_id": run_dir.name,
                     "error": "Missing extracted payload. Run /extract before /autofill.",
@@ -1535,18 +1536,16 @@ async def autofill(payload: Dict):
                 status_code=400,
             )
 
-        result = ExtractionResult.model_validate(result_payload)
-
         canonical_fields = None
         if run_id:
             canonical_path = run_dir / "canonical_fields.json"
             if canonical_path.exists():
-                canonical_payload = json.loads(canonical_path.read_text())
+                canonical_payload = orjson.loads(canonical_path.read_bytes())
                 canonical_fields = canonical_payload.get("fields") if isinstance(canonical_payload, dict) else None
         if not canonical_fields and run_id:
             resolved_path = run_dir / "resolved_fields.json"
             if resolved_path.exists():
-                resolved_payload = json.loads(resolved_path.read_text())
+                resolved_payload = orjson.loads(resolved_path.read_bytes())
                 if isinstance(resolved_payload, dict):
                     canonical_fields = resolved_payload
 
@@ -1569,7 +1568,7 @@ async def autofill(payload: Dict):
         )
         review_summary = summarize_review(review_report.get("fields", {}))
         if not review_summary.get("ready_for_autofill") and not force:
-            return JSONResponse(
+            return ORJSONResponse(
                 {
                     "error": "NOT_READY_FOR_AUTOFILL",
                     "summary": review_summary,
@@ -1584,9 +1583,9 @@ async def autofill(payload: Dict):
         if not payload_dict:
             extracted_path = run_dir / "extracted.json"
             if extracted_path.exists():
-                payload_dict = json.loads(extracted_path.read_text())
+                payload_dict = orjson.loads(extracted_path.read_bytes())
             else:
-                return JSONResponse(
+                return ORJSONResponse(
                     {
                         "run_id": run_dir.name,
                         "error": "Missing extracted payload. Run /extract before /autofill.",
@@ -1602,7 +1601,7 @@ async def autofill(payload: Dict):
                 for key, value in result.meta.resolved_fields.items()
             }
         if not resolved_payload:
-            return JSONResponse(
+            return ORJSONResponse(
                 {
                     "run_id": run_dir.name,
                     "error": "No canonical fields available. Run /review and /approve_canonical before /autofill.",
@@ -1614,7 +1613,7 @@ async def autofill(payload: Dict):
             payload_dict.setdefault("meta", {})
             payload_dict["meta"]["resolved_fields"] = resolved_payload
         if not _payload_has_autofill_values(payload_dict):
-            return JSONResponse(
+            return ORJSONResponse(
                 {
                     "run_id": run_dir.name,
                     "error": "No extracted values available. Run /extract before /autofill.",
@@ -1647,7 +1646,7 @@ async def autofill(payload: Dict):
             "keep_open_ms": keep_open_ms,
             "form_url": form_url or summary.get("form_url"),
         }
-        return JSONResponse({"run_id": run_dir.name, "summary": summary})
+        return ORJSONResponse({"run_id": run_dir.name, "summary": summary})
     except Exception as exc:  # noqa: BLE001
         _log_run(run_dir, f"Autofill failed: {exc}")
         summary = {
@@ -1660,7 +1659,7 @@ async def autofill(payload: Dict):
             "final_url": "",
             "error": str(exc),
         }
-        return JSONResponse({"run_id": run_dir.name, "summary": summary})
+        return ORJSONResponse({"run_id": run_dir.name, "summary": summary})
 
 
 @app.post("/validate")
@@ -1679,35 +1678,31 @@ async def validate(payload: Dict):
     )
     if report.llm_error:
         _log_run(run_dir, f"Validation LLM error: {report.llm_error}")
-    return JSONResponse({"run_id": run_dir.name, "result": result.model_dump(), "report": report.model_dump()})
+    return ORJSONResponse({"run_id": run_dir.name, "result": result.model_dump(), "report": report.model_dump()})
 
 
 @app.post("/post_autofill_validate")
 async def post_autofill_validate(payload: Dict):
     if not isinstance(payload, dict):
-        return JSONResponse({"error": "Invalid payload"}, status_code=400)
+        return ORJSONResponse({"error": "Invalid payload"}, status_code=400)
     run_id = payload.get("run_id")
     if not run_id:
-        return JSONResponse({"error": "Missing run_id"}, status_code=400)
+        return ORJSONResponse({"error": "Missing run_id"}, status_code=400)
     run_dir = RUNS_DIR / run_id
     run_dir.mkdir(parents=True, exist_ok=True)
     _log_run(run_dir, "Starting post-autofill validation")
 
-    result_payload = payload.get("result") if isinstance(payload, dict) else None
-    if not result_payload and run_id:
-        extracted_path = run_dir / "extracted.json"
-        if extracted_path.exists():
-            result_payload = json.loads(extracted_path.read_text())
-    if not result_payload:
-        return JSONResponse({"run_id": run_dir.name, "error": "Missing result payload"}, status_code=400)
+    result = _load_result(run_dir, payload.get("result") if isinstance(payload, dict) else None)
+    if result is None:
+        return ORJSONResponse({"run_id": run_dir.name, "error": "Missing result payload"}, status_code=400)
 
     autofill_report = payload.get("autofill_report") if isinstance(payload, dict) else None
     if not autofill_report and run_id:
         autofill_path = run_dir / "autofill_summary.json"
         if autofill_path.exists():
-            autofill_report = json.loads(autofill_path.read_text())
+            autofill_report = orjson.loads(autofill_path.read_bytes())
     if not autofill_report:
-        return JSONResponse(
+        return ORJSONResponse(
             {"run_id": run_dir.name, "error": "Missing autofill report; run /autofill first."},
             status_code=400,
         )
@@ -1721,7 +1716,6 @@ async def post_autofill_validate(payload: Dict):
     if g28_path.exists():
         g28_text = g28_path.read_text()
 
-    result = ExtractionResult.model_validate(result_payload)
     report, llm_error, updated = validate_post_autofill(
         result,
         autofill_report,
@@ -1746,7 +1740,7 @@ async def post_autofill_validate(payload: Dict):
     _write_json_artifact(run_dir, "e2e_coverage_report.json", coverage_report)
     _log_run(run_dir, "Post-autofill validation complete")
 
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "run_id": run_dir.name,
             "result": updated.model_dump(),
@@ -1811,23 +1805,18 @@ async def save_field_edits(payload: Dict):
     edits = payload.get("edits") if isinstance(payload, dict) else None
     force = bool(payload.get("force")) if isinstance(payload, dict) else False
     if not run_id:
-        return JSONResponse({"error": "Missing run_id"}, status_code=400)
+        return ORJSONResponse({"error": "Missing run_id"}, status_code=400)
     if not isinstance(edits, dict) or not edits:
-        return JSONResponse({"error": "Missing edits"}, status_code=400)
+        return ORJSONResponse({"error": "Missing edits"}, status_code=400)
 
     run_dir = RUNS_DIR / run_id
     if not run_dir.exists():
-        return JSONResponse({"error": "Run not found"}, status_code=404)
+        return ORJSONResponse({"error": "Run not found"}, status_code=404)
 
-    result_payload = payload.get("result") if isinstance(payload, dict) else None
-    if not result_payload:
-        extracted_path = run_dir / "extracted.json"
-        if extracted_path.exists():
-            result_payload = json.loads(extracted_path.read_text())
-    if not result_payload:
-        return JSONResponse({"error": "Missing extracted result"}, status_code=400)
+    result = _load_result(run_dir, payload.get("result") if isinstance(payload, dict) else None)
+    if result is None:
+        return ORJSONResponse({"error": "Missing extracted result"}, status_code=400)
 
-    result = ExtractionResult.model_validate(result_payload)
     now_iso = datetime.utcnow().isoformat()
     errors: Dict[str, str] = {}
     missing_warning_codes = {"label_present_no_value", "label_absent", "missing_required"}
@@ -1963,13 +1952,13 @@ async def save_field_edits(payload: Dict):
     autofill_path = run_dir / "autofill_summary.json"
     validation_path = run_dir / "post_autofill_validation.json"
     if autofill_path.exists():
-        autofill_report = json.loads(autofill_path.read_text())
+        autofill_report = orjson.loads(autofill_path.read_bytes())
     if validation_path.exists():
-        validation_report = json.loads(validation_path.read_text())
+        validation_report = orjson.loads(validation_path.read_bytes())
     _write_final_snapshot(run_dir, run_id, result, autofill_report, validation_report)
 
     response_payload = {"run_id": run_id, "result": result.model_dump(), "errors": errors}
-    return JSONResponse(response_payload)
+    return ORJSONResponse(response_payload)
 
 
 @app.post("/run_all")
@@ -2047,7 +2036,7 @@ async def run_all(
         f"run_all: validation complete ok={report.ok} issues={len(report.issues)} score={report.score:.2f}",
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "run_id": run_dir.name,
             "result": result.model_dump(),
@@ -2068,15 +2057,15 @@ async def verify(payload: Dict):
     if not result_payload and run_id:
         extracted_path = run_dir / "extracted.json"
         if extracted_path.exists():
-            result_payload = json.loads(extracted_path.read_text())
+            result_payload = orjson.loads(extracted_path.read_bytes())
     if not result_payload:
-        return JSONResponse({"run_id": run_dir.name, "error": "Missing result payload"}, status_code=400)
+        return ORJSONResponse({"run_id": run_dir.name, "error": "Missing result payload"}, status_code=400)
 
     autofill_report = payload.get("autofill_report") if isinstance(payload, dict) else None
     if not autofill_report and run_id:
         autofill_path = run_dir / "autofill_summary.json"
         if autofill_path.exists():
-            autofill_report = json.loads(autofill_path.read_text())
+            autofill_report = orjson.loads(autofill_path.read_bytes())
 
     passport_text = ""
     g28_text = ""
@@ -2134,7 +2123,7 @@ async def verify(payload: Dict):
         _write_json_artifact(run_dir, "verification.json", result.meta.llm_verification)
     _log_run(run_dir, "Verify complete")
 
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "run_id": run_dir.name,
             "result": result.model_dump(),
@@ -1,37 +1,49 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 from ..schemas import ExtractionResult, SuggestionOption
 
+ALPHA_RE = re.compile(r"[A-Za-z]")
+DIGIT_RE = re.compile(r"\d")
+
+
+@lru_cache(maxsize=1024)
+def _path_parts(path: str) -> Tuple[Tuple[str, ...], str]:
+    *parents, leaf = path.split(".")
+    return tuple(parents), leaf
+
 
 def _set_nested_attr(obj, path: str, value):
-    parts = path.split(".")
+    parents, leaf = _path_parts(path)
     target = obj
-    for part in parts[:-1]:
+    for part in parents:
         target = getattr(target, part)
-    setattr(target, parts[-1], value)
+    setattr(target, leaf, value)
+
+
+SOURCE_BASE_CONFIDENCE: Dict[str, float] = {
+    "MRZ": 0.95,
+    "LLM": 0.7,
+    "AI": 0.7,
+    "USER": 1.0,
+    "VALIDATOR": 0.85,
+    "MERGE": 0.85,
+    "PASSPORT": 0.85,
+    "OCR": 0.75,
+}
+DEFAULT_BASE_CONFIDENCE = 0.7
+OCR_FUZZY_BASE_CONFIDENCE = 0.6
 
 
 def _base_confidence_for_source(source: str, match_quality: str = "exact") -> float:
     source_key = source.upper()
-    if source_key == "MRZ":
-        return 0.95
-    if source_key == "LLM":
-        return 0.7
-    if source_key == "AI":
-        return 0.7
-    if source_key == "USER":
-        return 1.0
-    if source_key == "VALIDATOR":
-        return 0.85
-    if source_key in {"MERGE", "PASSPORT"}:
-        return 0.85
     # OCR baseline depends on match quality.
-    if source_key == "OCR":
-        return 0.6 if match_quality == "fuzzy" else 0.75
-    return 0.7
+    if source_key == "OCR" and match_quality == "fuzzy":
+        return OCR_FUZZY_BASE_CONFIDENCE
+    return SOURCE_BASE_CONFIDENCE.get(source_key, DEFAULT_BASE_CONFIDENCE)
 
 
 def base_confidence_for_source(source: str, match_quality: str = "exact") -> float:
@@ -52,8 +64,8 @@ def _value_quality_score(value: Optional[str], evidence: Optional[str] = None) -
     text = str(value).strip()
     length_bonus = min(len(text) / 32, 1.0) * 0.1
 
-    has_alpha = bool(re.search(r"[A-Za-z]", text))
-    has_digit = bool(re.search(r"\d", text))
+    has_alpha = ALPHA_RE.search(text) is not None
+    has_digit = DIGIT_RE.search(text) is not None
     balance_bonus = 0.0
     if has_alpha:
         balance_bonus += 0.015
@@ -1,26 +1,65 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
+import os
+import re
+import shutil
+import tempfile
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
 import numpy as np
 from pdf2image import convert_from_path
 from PIL import Image, ImageOps
 
+try:
+    import fastpdf2png
+except ImportError:  # Only published for Linux; other platforms render through Poppler.
+    fastpdf2png = None
+
 LOGGER = logging.getLogger(__name__)
 
 
 SUPPORTED_IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".tif", ".tiff"}
+PDF_RENDER_DPI = 300
+INGEST_CACHE_SIZE = 8
+INGEST_CACHE_ENV = "DOC_EXTRACTOR_INGEST_CACHE"
+INGEST_CACHE_DIR = Path.home() / ".cache" / "doc-extractor" / "ingest"
+INGEST_CACHE_MAX_BYTES = 512 * 1024 * 1024
 
+_FASTPDF2PNG_FAILED = False
+_LOADER_ERROR_RE = re.compile(r"GLIBC_[\d.]+' not found|error while loading shared libraries|cannot execute")
 
-def load_document(path: Path) -> List[Image.Image]:
-    """Load a PDF or image file and return a list of PIL images."""
+# (mode, size, raw pixels) per page; cached pages are immutable and rebuilt per call.
+PageData = Tuple[str, Tuple[int, int], bytes]
+
+
+def _render_pdf(path: Path) -> List[Image.Image]:
+    global _FASTPDF2PNG_FAILED
+    if fastpdf2png is not None and not _FASTPDF2PNG_FAILED:
+        try:
+            pages = fastpdf2png.to_images(str(path), dpi=PDF_RENDER_DPI)
+        except (OSError, RuntimeError) as exc:
+            # Only a binary that cannot start (exec or dynamic-loader failure, e.g. glibc too old)
+            # disables the fast path; a document it rejects (corrupt, encrypted) falls back alone.
+            if isinstance(exc, OSError) or _LOADER_ERROR_RE.search(str(exc)):
+                _FASTPDF2PNG_FAILED = True
+                LOGGER.warning("fastpdf2png cannot run on this host (%s); using pdf2image from now on", exc)
+            else:
+                LOGGER.warning("fastpdf2png failed for %s (%s); falling back to pdf2image", path, exc)
+        else:
+            # Grayscale pages come back as "L"; keep the same modes the image branch allows.
+            return [page if page.mode in {"RGB", "L"} else page.convert("RGB") for page in pages]
+    return convert_from_path(str(path), dpi=PDF_RENDER_DPI)
+
+
+def _load_document_uncached(path: Path) -> List[Image.Image]:
     suffix = path.suffix.lower()
     if suffix == ".pdf":
         LOGGER.info("Rendering PDF %s to images", path)
-        pages = convert_from_path(str(path), dpi=300)
-        return pages
+        return _render_pdf(path)
     if suffix in SUPPORTED_IMAGE_EXTS:
         LOGGER.info("Loading image %s", path)
         image = Image.open(path)
@@ -32,6 +71,98 @@ def load_document(path: Path) -> List[Image.Image]:
     raise ValueError(f"Unsupported file type: {suffix}")
 
 
+def _freeze_pages(pages: List[Image.Image]) -> Tuple[PageData, ...]:
+    return tuple((page.mode, page.size, page.tobytes()) for page in pages)
+
+
+def _ingest_cache_enabled() -> bool:
+    return os.getenv(INGEST_CACHE_ENV, "").lower() in {"1", "true", "yes"}
+
+
+def _disk_cache_path(path: Path) -> Path:
+    digest = hashlib.sha256(path.read_bytes())
+    # Rendering settings are part of the key so a DPI change never serves stale pages.
+    digest.update(f"{path.suffix.lower()}:{PDF_RENDER_DPI}".encode())
+    return INGEST_CACHE_DIR / digest.hexdigest()
+
+
+def _read_disk_cache(entry: Path) -> Optional[Tuple[PageData, ...]]:
+    page_paths = sorted(entry.glob("page-*.png"))
+    if not page_paths:
+        return None
+    pages = []
+    for page_path in page_paths:
+        with Image.open(page_path) as image:
+            if image.format != "PNG" or image.mode not in {"RGB", "L"}:
+                return None
+            image.load()
+            pages.append(image.copy())
+    os.utime(entry)  # mark as recently used for pruning
+    return _freeze_pages(pages)
+
+
+def _write_disk_cache(entry: Path, pages: Tuple[PageData, ...]) -> None:
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=entry.parent, prefix=".staging-"))
+    try:
+        for index, (mode, size, data) in enumerate(pages):
+            Image.frombytes(mode, size, data).save(staging / f"page-{index:03d}.png", compress_level=1)
+        os.replace(staging, entry)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def _prune_disk_cache() -> None:
+    entries = []
+    for entry in INGEST_CACHE_DIR.iterdir():
+        if not entry.is_dir() or entry.name.startswith("."):
+            continue
+        try:
+            size = sum(page.stat().st_size for page in entry.iterdir())
+            entries.append((entry.stat().st_mtime, size, entry))
+        except OSError:
+            continue
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda item: item[0]):
+        if total <= INGEST_CACHE_MAX_BYTES:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
+
+
+@functools.lru_cache(maxsize=INGEST_CACHE_SIZE)
+def _load_document_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[PageData, ...]:
+    path = Path(path_str)
+    entry = _disk_cache_path(path)
+    if entry.is_dir():
+        try:
+            cached = _read_disk_cache(entry)
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable ingest cache %s: %s", entry, exc)
+        else:
+            if cached is not None:
+                return cached
+        shutil.rmtree(entry, ignore_errors=True)
+    pages = _freeze_pages(_load_document_uncached(path))
+    try:
+        _write_disk_cache(entry, pages)
+        _prune_disk_cache()
+    except OSError as exc:
+        LOGGER.warning("Unable to write ingest cache %s: %s", entry, exc)
+    return pages
+
+
+def load_document(path: Path) -> List[Image.Image]:
+    """Load a PDF or image file and return a list of PIL images."""
+    # Uploads land in a fresh run dir each time, so caching only pays off for repeated local runs.
+    if not _ingest_cache_enabled():
+        return _load_document_uncached(path)
+    stat = path.stat()
+    pages = _load_document_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    return [Image.frombytes(mode, size, data) for mode, size, data in pages]
+
+
 def preprocess_image(image: Image.Image) -> Image.Image:
     """Normalize image for OCR with grayscale + gentle thresholding when it helps."""
     # Preserve orientation metadata on image uploads.
@@ -1,13 +1,35 @@
 from __future__ import annotations
 
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Optional
 
+import fasttext
 from langdetect import DetectorFactory, LangDetectException, detect_langs
 
+LOGGER = logging.getLogger(__name__)
+
 
 DetectorFactory.seed = 0
 
+FASTTEXT_MODEL_ENV = "LANG_DETECT_FASTTEXT_MODEL"
+DEFAULT_FASTTEXT_MODEL_PATH = Path(__file__).resolve().parents[1] / "models" / "lid.176.ftz"
+FASTTEXT_LABEL_PREFIX = "__label__"
+
+_FASTTEXT_LOCK = threading.Lock()
+_FASTTEXT_MODEL: Optional[object] = None
+_FASTTEXT_LOADED = False
+
+DETECTION_CACHE_SIZE = 1024
+# Keyed on a digest of the sample so long OCR texts are not kept alive by the cache.
+_DETECTION_CACHE: "OrderedDict[bytes, LanguageDetectionResult]" = OrderedDict()
+_DETECTION_CACHE_LOCK = threading.Lock()
+
 
 LANGUAGE_LABELS: Dict[str, str] = {
     "en": "English",
@@ -29,6 +51,7 @@ LANGUAGE_LABELS: Dict[str, str] = {
     "ar": "Arabic",
     "he": "Hebrew",
     "hi": "Hindi",
+    "zh": "Chinese",
     "zh-cn": "Chinese (Simplified)",
     "zh-tw": "Chinese (Traditional)",
     "ja": "Japanese",
@@ -42,10 +65,57 @@ class LanguageDetectionResult:
     confidence: float
 
 
+def _fasttext_model():
+    """Load the fastText language-ID model on first use; None when it is unavailable."""
+    global _FASTTEXT_MODEL, _FASTTEXT_LOADED
+    if _FASTTEXT_LOADED:
+        return _FASTTEXT_MODEL
+    with _FASTTEXT_LOCK:
+        if not _FASTTEXT_LOADED:
+            model_path = Path(os.getenv(FASTTEXT_MODEL_ENV) or DEFAULT_FASTTEXT_MODEL_PATH)
+            if model_path.exists():
+                try:
+                    _FASTTEXT_MODEL = fasttext.load_model(str(model_path))
+                except ValueError as exc:
+                    LOGGER.warning("Unable to load fastText model %s: %s", model_path, exc)
+            _FASTTEXT_LOADED = True
+    return _FASTTEXT_MODEL
+
+
 def detect_language(text: str, max_chars: int = 4000) -> LanguageDetectionResult:
     if not text or not text.strip():
         return LanguageDetectionResult(language="unknown", confidence=0.0)
     sample = text.strip()[:max_chars]
+    key = hashlib.blake2b(sample.encode("utf-8"), digest_size=16).digest()
+    with _DETECTION_CACHE_LOCK:
+        cached = _DETECTION_CACHE.get(key)
+        if cached is not None:
+            _DETECTION_CACHE.move_to_end(key)
+            return cached
+    detection = _detect_sample(sample)
+    with _DETECTION_CACHE_LOCK:
+        _DETECTION_CACHE[key] = detection
+        if len(_DETECTION_CACHE) > DETECTION_CACHE_SIZE:
+            _DETECTION_CACHE.popitem(last=False)
+    return detection
+
+
+def clear_detection_cache() -> None:
+    with _DETECTION_CACHE_LOCK:
+        _DETECTION_CACHE.clear()
+
+
+def _detect_sample(sample: str) -> LanguageDetectionResult:
+    model = _fasttext_model()
+    if model is not None:
+        labels, probs = model.predict(" ".join(sample.split()), k=1)
+        if not labels:
+            return LanguageDetectionResult(language="unknown", confidence=0.0)
+        return LanguageDetectionResult(
+            language=labels[0][len(FASTTEXT_LABEL_PREFIX) :],
+            confidence=min(float(probs[0]), 1.0),
+        )
+    # Fall back to langdetect when the fastText model has not been provisioned.
     try:
         candidates = detect_langs(sample)
     except LangDetectException:
@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from functools import lru_cache
 from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+
 from .ocr import OCRResult
 from .label_noise import looks_like_label_value
 from .normalize import (
@@ -25,6 +27,13 @@ LOGGER = logging.getLogger(__name__)
 # MRZ OCR often includes a stray character; allow slight overrun and require filler "<".
 MRZ_LINE_RE = re.compile(r"^(?=.*<)[A-Z0-9<]{30,46}$")
 MRZ_CANDIDATE_RE = re.compile(r"[A-Z0-9<]{30,46}")
+# Strict TD3 layout for two adjacent, already-normalized lines (document code, names / number,
+# nationality, dates, sex, personal number and check digits).
+TD3_PAIR_RE = re.compile(
+    r"^(P[A-Z0-9<][A-Z<]{3}[A-Z<]{39})\n"
+    r"([A-Z0-9<]{9}[0-9][A-Z<]{3}[0-9]{7}[MFX<][0-9]{7}[A-Z0-9<]{14}[0-9<][0-9])$",
+    re.MULTILINE,
+)
 SMALL_NOISE_TOKENS = {"no", "nr", "id", "ap", "pg"}
 NAME_PARTICLES = {"of", "de", "du", "la", "le", "del", "d", "da", "dos", "das"}
 LABEL_STOPWORDS = {
@@ -418,18 +427,20 @@ def _best_mrz_line1(line: str) -> str:
 def _best_mrz_line2(line: str) -> str:
     if len(line) <= 44:
         return line
+    # OCR over-reads by a char or two, too few windows to amortise NumPy setup; scan them in order.
     best_line = line[:44]
     best_score = -1.0
     for idx in range(0, len(line) - 43):
         candidate = line[idx : idx + 44]
         if "<" not in candidate:
             continue
+        data = candidate.encode("ascii", "replace")
         score = 0.0
-        if _valid_check_digit(candidate[0:9], candidate[9:10]):
+        if candidate[9] == str(mrz_check(data[0:9])):
             score += 2.0
-        if _valid_check_digit(candidate[13:19], candidate[19:20]):
+        if candidate[19] == str(mrz_check(data[13:19])):
             score += 1.5
-        if _valid_check_digit(candidate[21:27], candidate[27:28]):
+        if candidate[27] == str(mrz_check(data[21:27])):
             score += 1.5
         if re.fullmatch(r"[A-Z]{3}", candidate[10:13]):
             score += 0.5
@@ -499,24 +510,61 @@ class HeuristicResult:
     evidence: Dict[str, str]
 
 
-def _compute_check_digit(value: str) -> str:
-    weights = [7, 3, 1]
-    total = 0
-    for i, char in enumerate(value):
-        if char.isdigit():
-            v = int(char)
-        elif char == "<":
-            v = 0
-        else:
-            v = ord(char) - 55
-        total += v * weights[i % 3]
-    return str(total % 10)
+# ICAO 9303 character values: 0-9 -> 0-9, A-Z -> 10-35, filler "<" -> 0. Every other byte
+# keeps the legacy ord(c) - 55 value, so stray OCR characters score as they always have.
+MRZ_VALUES = tuple(
+    byte - ord("0") if chr(byte).isdigit() else 0 if byte == ord("<") else byte - 55 for byte in range(256)
+)
+MRZ_WEIGHTS = (7, 3, 1)
+MRZ_CHAR_VALUES = np.array(MRZ_VALUES, dtype=np.int64)
+# TD3 line 2 check digits: (name, data slices, check digit position). The composite covers
+# the number, birth and expiry blocks plus the personal number, weighted as one string.
+TD3_CHECKS = (
+    ("passport_number", ((0, 9),), 9),
+    ("date_of_birth", ((13, 19),), 19),
+    ("date_of_expiration", ((21, 27),), 27),
+    ("composite", ((0, 10), (13, 20), (21, 43)), 43),
+)
 
 
-def _valid_check_digit(value: str, check_digit: str) -> bool:
-    if not check_digit or check_digit == "<":
-        return False
-    return _compute_check_digit(value) == check_digit
+def _td3_check_layout() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    indices: List[np.ndarray] = []
+    weights: List[np.ndarray] = []
+    offsets: List[int] = []
+    size = 0
+    for _, slices, _ in TD3_CHECKS:
+        positions = np.concatenate([np.arange(start, stop) for start, stop in slices])
+        offsets.append(size)
+        indices.append(positions)
+        weights.append(np.resize(np.array(MRZ_WEIGHTS, dtype=np.int64), len(positions)))
+        size += len(positions)
+    return np.concatenate(indices), np.concatenate(weights), np.array(offsets)
+
+
+TD3_CHECK_INDEX, TD3_CHECK_WEIGHTS, TD3_CHECK_OFFSETS = _td3_check_layout()
+
+
+def _mrz_values(value: str) -> np.ndarray:
+    return MRZ_CHAR_VALUES[np.frombuffer(value.encode("ascii", "replace"), dtype=np.uint8)]
+
+
+def mrz_check(field: bytes) -> int:
+    """Return the ICAO 9303 check digit for an MRZ field of any length."""
+    # A plain loop beats a NumPy gather + dot product on 6-9 byte fields.
+    total = 0
+    for index, byte in enumerate(field):
+        total += MRZ_VALUES[byte] * MRZ_WEIGHTS[index % 3]
+    return total % 10
+
+
+def _td3_check_results(line2: str) -> Dict[str, bool]:
+    """Verify every TD3 line 2 check digit with a single segmented reduction."""
+    weighted = _mrz_values(line2)[TD3_CHECK_INDEX] * TD3_CHECK_WEIGHTS
+    expected = np.add.reduceat(weighted, TD3_CHECK_OFFSETS) % 10
+    return {
+        name: line2[position] == str(digit)
+        for (name, _, position), digit in zip(TD3_CHECKS, expected.tolist())
+    }
 
 
 def _normalize_mrz_line(raw: str) -> str:
@@ -527,8 +575,12 @@ def _normalize_mrz_line(raw: str) -> str:
 def extract_mrz_lines(text: str) -> List[str]:
     lines = []
     long_lines: List[str] = []
-    for raw in text.splitlines():
-        line = _normalize_mrz_line(raw)
+    normalized_lines = [_normalize_mrz_line(raw) for raw in text.splitlines()]
+    # A clean TD3 pair wins outright, even when MRZ-like noise follows it on the page.
+    pairs = TD3_PAIR_RE.findall("\n".join(normalized_lines))
+    if pairs:
+        return list(pairs[-1])
+    for line in normalized_lines:
         if MRZ_LINE_RE.match(line):
             lines.append(line)
         elif len(line) >= 44:
@@ -578,13 +630,10 @@ def parse_mrz_td3(lines: List[str]) -> Optional[MRZResult]:
     names_raw = line1[5:44]
 
     passport_number = line2[0:9].replace("<", "") or None
-    passport_cd = line2[9:10]
     nationality = line2[10:13].replace("<", "") or None
     dob_raw = line2[13:19]
-    dob_cd = line2[19:20]
     sex = line2[20:21]
     expiry_raw = line2[21:27]
-    expiry_cd = line2[27:28]
 
     # If the issuing country looks wrong compared to nationality, the MRZ line may be missing the country code.
     if nationality and issuing_country and issuing_country != nationality:
@@ -601,11 +650,7 @@ def parse_mrz_td3(lines: List[str]) -> Optional[MRZResult]:
     surname = name_parts[0].replace("<", " ").strip() or None
     given_names = " ".join(name_parts[1:]).replace("<", " ").strip() or None
 
-    checks_ok = {
-        "passport_number": _valid_check_digit(line2[0:9], passport_cd),
-        "date_of_birth": _valid_check_digit(dob_raw, dob_cd),
-        "date_of_expiration": _valid_check_digit(expiry_raw, expiry_cd),
-    }
+    checks_ok = _td3_check_results(line2)
 
     normalized_given = normalize_passport_name(given_names)
     normalized_surname = normalize_passport_name(surname)
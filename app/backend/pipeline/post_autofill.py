@@ -90,8 +90,7 @@ def _values_equal(a: Optional[str], b: Optional[str]) -> bool:
     return str(a or "").strip() == str(b or "").strip()
 
 
-def _resolved_override_value(result: ExtractionResult, path: str) -> Optional[str]:
-    entry = (result.meta.resolved_fields or {}).get(path)
+def _resolved_override_value(entry: Optional[ResolvedField]) -> Optional[str]:
     if not entry:
         return None
     source = str(entry.source or "").upper()
@@ -164,6 +163,22 @@ def _resolve_prompt_style(contexts: List[Dict]) -> str:
     return "fast"
 
 
+LLM_HIGH_RISK_FIELDS = frozenset({"passport.place_of_birth"})
+LLM_HIGH_RISK_TYPES = frozenset(
+    {
+        "name",
+        "date_past",
+        "date_future",
+        "passport_number",
+        "email",
+        "phone",
+        "state",
+        "zip",
+        "sex",
+    }
+)
+
+
 def _llm_validate_scope() -> str:
     raw = os.getenv("LLM_VALIDATE_SCOPE", "smart").strip().lower()
     if raw in {"all", "smart", "issues", "issues_only", "required_only"}:
@@ -171,11 +186,21 @@ def _llm_validate_scope() -> str:
     return "smart"
 
 
-def _estimate_prompt_tokens(contexts: List[Dict], prompt_style: str) -> int:
+def _payload_item_chars(context: Dict) -> int:
+    # Compact JSON for one context plus the comma that joins it to the payload list.
+    return len(json.dumps(context, ensure_ascii=True, separators=(",", ":"))) + 1
+
+
+def _batch_tokens(payload_chars: int, count: int, prompt_style: str) -> int:
     template = FIELD_VALIDATION_PROMPT_FAST if prompt_style == "fast" else FIELD_VALIDATION_PROMPT
-    payload = json.dumps(contexts, ensure_ascii=True, separators=(",", ":"))
-    output_tokens = _read_env_int("LLM_VALIDATE_OUTPUT_TOKENS_PER_FIELD", 40) * len(contexts)
-    return _estimate_tokens(template) + _estimate_tokens(payload) + output_tokens
+    output_tokens = _read_env_int("LLM_VALIDATE_OUTPUT_TOKENS_PER_FIELD", 40) * count
+    return _estimate_tokens(template) + max(1, payload_chars // 4) + output_tokens
+
+
+def _estimate_prompt_tokens(contexts: List[Dict], prompt_style: str) -> int:
+    # "[" + "]", less the comma the first item doesn't need.
+    payload_chars = 1 + sum(_payload_item_chars(context) for context in contexts)
+    return _batch_tokens(payload_chars, len(contexts), prompt_style)
 
 
 def _auto_batch_size(contexts: List[Dict], prompt_style: str) -> int:
@@ -190,18 +215,17 @@ def _auto_batch_size(contexts: List[Dict], prompt_style: str) -> int:
     return batch if batch < len(contexts) else 0
 
 
-def _resolve_batch_size(contexts: List[Dict], prompt_style: Optional[str] = None) -> int:
+def _explicit_batch_size() -> int:
     raw = os.getenv("LLM_VALIDATE_BATCH_SIZE", "auto").strip().lower()
-    style = prompt_style or _resolve_prompt_style(contexts)
-    if raw in {"", "auto"}:
-        return _auto_batch_size(contexts, style)
     try:
-        batch_size = int(raw)
+        return max(0, int(raw))
     except ValueError:
-        batch_size = 0
-    if batch_size <= 0:
-        return _auto_batch_size(contexts, style)
-    return batch_size
+        return 0
+
+
+def _resolve_batch_size(contexts: List[Dict], prompt_style: Optional[str] = None) -> int:
+    style = prompt_style or _resolve_prompt_style(contexts)
+    return _explicit_batch_size() or _auto_batch_size(contexts, style)
 
 
 def _allow_placeholder(spec) -> bool:
@@ -340,6 +364,7 @@ def _human_reason_payload(
 def _should_invoke_llm(
     *,
     spec,
+    scope: str,
     deterministic_status: str,
     conflict: bool,
     failure_reason: Optional[str],
@@ -347,7 +372,6 @@ def _should_invoke_llm(
     value_missing: bool,
     attempted: bool,
 ) -> bool:
-    scope = _llm_validate_scope()
     if scope == "all":
         return True
     if scope in {"issues", "issues_only"}:
@@ -356,8 +380,7 @@ def _should_invoke_llm(
         return bool(spec.required and not value_missing)
 
     # Some OCR-prone fields are worth validating even when deterministic rules pass.
-    high_risk_fields = {"passport.place_of_birth"}
-    if spec.key in high_risk_fields and not value_missing:
+    if spec.key in LLM_HIGH_RISK_FIELDS and not value_missing:
         return True
 
     # Smart default: skip clear non-issues, focus on autofilled + risky fields.
@@ -372,18 +395,7 @@ def _should_invoke_llm(
     if spec.required and not value_missing:
         return True
 
-    high_risk_types = {
-        "name",
-        "date_past",
-        "date_future",
-        "passport_number",
-        "email",
-        "phone",
-        "state",
-        "zip",
-        "sex",
-    }
-    return bool(not value_missing and spec.field_type in high_risk_types)
+    return bool(not value_missing and spec.field_type in LLM_HIGH_RISK_TYPES)
 
 
 def _normalize_status(value: Optional[str]) -> Optional[str]:
@@ -435,10 +447,39 @@ def _trivial_normalization(a: Optional[str], b: Optional[str]) -> bool:
     return bool(a_norm) and a_norm == b_norm
 
 
-def _chunk_contexts(contexts: List[Dict], batch_size: int) -> List[List[Dict]]:
+def _context_length(context: Dict) -> int:
+    return sum(len(context.get(key) or "") for key in ("extracted_value", "dom_readback_value", "evidence"))
+
+
+def _chunk_contexts(
+    contexts: List[Dict],
+    batch_size: int,
+    prompt_style: str = "fast",
+    token_budget: Optional[int] = None,
+) -> List[List[Dict]]:
     if batch_size <= 0:
         return [contexts]
-    return [contexts[i : i + batch_size] for i in range(0, len(contexts), batch_size)]
+    # Results are keyed by field, so group similar-sized contexts to keep batch prompts even.
+    # With a token budget (auto sizing), the longest contexts sorted to the end spill into
+    # extra batches instead of overflowing the last one.
+    chunks: List[List[Dict]] = []
+    current: List[Dict] = []
+    payload_chars = 1
+    for context in sorted(contexts, key=_context_length):
+        item_chars = _payload_item_chars(context)
+        over_budget = (
+            token_budget is not None
+            and _batch_tokens(payload_chars + item_chars, len(current) + 1, prompt_style) > token_budget
+        )
+        if current and (len(current) >= batch_size or over_budget):
+            chunks.append(current)
+            current = []
+            payload_chars = 1
+        current.append(context)
+        payload_chars += item_chars
+    if current:
+        chunks.append(current)
+    return chunks
 
 
 def _call_llm_validation(contexts: List[Dict]) -> Tuple[List[Dict], Optional[str]]:
@@ -492,6 +533,13 @@ def validate_post_autofill(
     fill_failures = autofill_report.get("fill_failures", {}) or {}
     dom_readback = autofill_report.get("dom_readback", {}) or {}
     existing_resolved = result.meta.resolved_fields or {}
+    presence_by_field = result.meta.presence
+    evidence_by_field = result.meta.evidence
+    # Fields locked by the user or AI are reported as-is and never reach the LLM.
+    locked_fields = frozenset(
+        path for path, resolved in existing_resolved.items() if _locked_by_user_or_ai(resolved)
+    )
+    llm_scope = _llm_validate_scope() if use_llm else None
     conflict_fields = set((result.meta.conflicts or {}).keys())
     warning_conflicts = {
         warning.field
@@ -512,9 +560,9 @@ def validate_post_autofill(
     for spec in iter_fields():
         path = spec.key
         existing = existing_resolved.get(path)
-        locked_by_user_or_ai = _locked_by_user_or_ai(existing)
+        locked_by_user_or_ai = path in locked_fields
         extracted_value = _get_value(payload, path)
-        resolved_override_value = _resolved_override_value(result, path)
+        resolved_override_value = _resolved_override_value(existing)
         entry = autofill_field_results.get(path) if isinstance(autofill_field_results, dict) else None
         dom_value = None
         selector_used = None
@@ -540,7 +588,7 @@ def validate_post_autofill(
                 autofill_result = "PASS"
             else:
                 autofill_result = "SKIP"
-        presence = result.meta.presence.get(path, "unknown")
+        presence = presence_by_field.get(path, "unknown")
 
         value = dom_value if dom_value is not None else extracted_value
         value = str(value).strip() if value is not None else ""
@@ -717,9 +765,10 @@ def validate_post_autofill(
             "llm_validation_invoked": False,
         }
 
-        evidence = result.meta.evidence.get(path) or ""
-        llm_needed = _should_invoke_llm(
+        evidence = evidence_by_field.get(path) or ""
+        llm_needed = llm_scope is not None and _should_invoke_llm(
             spec=spec,
+            scope=llm_scope,
             deterministic_status=deterministic_status,
             conflict=conflict,
             failure_reason=failure_reason_for_rules,
@@ -727,11 +776,8 @@ def validate_post_autofill(
             value_missing=value_missing,
             attempted=attempted,
         )
-        if locked_by_user_or_ai:
-            llm_invoked[path] = False
-        else:
-            llm_invoked[path] = bool(use_llm and llm_needed)
-        if use_llm and llm_needed and not locked_by_user_or_ai:
+        llm_invoked[path] = llm_needed
+        if llm_needed:
             label_text = _normalize_llm_text(spec.label, label_limit)
             extracted_text = _normalize_llm_text(extracted_value, value_limit)
             dom_text = _normalize_llm_text(dom_value, value_limit)
@@ -796,8 +842,10 @@ def validate_post_autofill(
         llm_call = llm_client or _call_llm_validation
         prompt_style = _resolve_prompt_style(contexts)
         batch_size = _resolve_batch_size(contexts, prompt_style)
+        # An explicit LLM_VALIDATE_BATCH_SIZE is taken as-is; only auto sizing splits on tokens.
+        token_budget = None if _explicit_batch_size() else _read_env_int("LLM_VALIDATE_TARGET_TOKENS", 3500)
         errors = []
-        for batch in _chunk_contexts(contexts, batch_size):
+        for batch in _chunk_contexts(contexts, batch_size, prompt_style, token_budget):
             llm_payload, error = llm_call(batch)
             if error:
                 errors.append(error)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+import orjson
+
 from ..field_registry import iter_fields
 
 DOC_ARTIFACT_DIRNAME = "doc_artifacts"
@@ -62,7 +63,7 @@ def read_text_artifact(run_dir: Path, doc_type: str) -> Optional[Dict[str, objec
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text())
+        return orjson.loads(path.read_bytes())
     except Exception:  # noqa: BLE001
         return None
 
@@ -149,7 +150,7 @@ def upsert_text_artifact(
     }
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2))
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     return payload
 
 
@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -11,6 +12,7 @@ import requests
 
 from .confidence import add_suggestion, base_confidence_for_source
 from .label_noise import is_placeholder_value, looks_like_label_value
+from .passport import mrz_check
 from .prompts import build_llm_validate_prompt
 from .rules import RE_ZIP_US, RuleResult, validate_field
 from ..field_registry import iter_validation_fields
@@ -83,18 +85,10 @@ def _field_specific_invalid(path: str, value: str, payload: Dict) -> Tuple[bool,
     return False, None, "field_ok"
 
 
+# Cached wrapper around the scalar passport.mrz_check; fields repeat across validation passes.
+@lru_cache(maxsize=128)
 def _compute_check_digit(value: str) -> str:
-    weights = [7, 3, 1]
-    total = 0
-    for i, char in enumerate(value):
-        if char.isdigit():
-            v = int(char)
-        elif char == "<":
-            v = 0
-        else:
-            v = ord(char) - 55
-        total += v * weights[i % 3]
-    return str(total % 10)
+    return str(mrz_check(value.encode("ascii", "replace")))
 
 
 def _valid_check_digit(value: str, check_digit: str) -> bool:
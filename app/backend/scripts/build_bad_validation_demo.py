@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
+from typing import Any
 
+import orjson
 from PIL import Image, ImageDraw, ImageFont
+from pydantic import BaseModel
 
 from backend.field_registry import iter_fields
-from backend.pipeline.confidence import set_field
-from backend.schemas import ExtractionResult
+from backend.pipeline.confidence import estimate_confidence
+from backend.schemas import ExtractionResult, MetaData
 
 
 DATASETS_DIR = Path(__file__).resolve().parents[3] / "datasets"
@@ -101,65 +106,65 @@ def _default_value(path: str, field_type: str) -> str:
     return "Sample"
 
 
+LANGUAGE_OVERRIDES: dict[str, list[tuple[str, str, str]]] = {
+    "es": [
+        ("passport.surname", "GARCIA", "Apellido: GONZALEZ"),
+    ],
+    "zh": [
+        ("passport.surname", "WANG", "姓: 王 (WANG)"),
+        ("passport.given_names", "WEI", "名: 伟 (WEI)"),
+        ("passport.date_of_birth", "1990-01-01", "出生日期：1991年01月01日"),
+        ("passport.date_of_expiration", "2012-04-15", "有效期至：2012年04月15日"),
+    ],
+}
+
+
+def _construct(model_cls: type[BaseModel], data: dict[str, Any]) -> BaseModel:
+    kwargs: dict[str, Any] = {}
+    for name, value in data.items():
+        annotation = model_cls.model_fields[name].annotation
+        if isinstance(value, dict) and isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            value = _construct(annotation, value)
+        kwargs[name] = value
+    return model_cls.model_construct(**kwargs)
+
+
 def _build_result(language: str) -> tuple[ExtractionResult, dict]:
-    result = ExtractionResult()
+    # Every value here is a trusted demo string, so collect the fields first and build the
+    # result tree once with model_construct instead of assigning through set_field.
     dom_readback: dict[str, str] = {}
-
+    evidence: dict[str, str] = {}
     for spec in iter_fields():
         value = _default_value(spec.key, spec.field_type)
-        evidence = f"{spec.label}: {value}"
-        set_field(result, spec.key, value, "OCR", None, evidence)
         dom_readback[spec.key] = value
+        evidence[spec.key] = f"{spec.label}: {value}"
+    for path, value, snippet in LANGUAGE_OVERRIDES[language]:
+        dom_readback[path] = value
+        evidence[path] = snippet
+
+    nested: dict[str, Any] = {}
+    for path, value in dom_readback.items():
+        *parents, leaf = path.split(".")
+        target = nested
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = value
+
+    meta = MetaData.model_construct(
+        sources={path: "OCR" for path in dom_readback},
+        confidence={
+            path: estimate_confidence("OCR", value, evidence[path])
+            for path, value in dom_readback.items()
+        },
+        status={path: "unknown" for path in dom_readback},
+        evidence=evidence,
+    )
+    result = _construct(ExtractionResult, {**nested, "meta": meta})
 
     if language == "es":
-        set_field(
-            result,
-            "passport.surname",
-            "GARCIA",
-            "OCR",
-            None,
-            "Apellido: GONZALEZ",
-        )
-        dom_readback["passport.surname"] = "GARCIA"
         passport_text = SPANISH_PASSPORT_TEXT
         g28_text = SPANISH_G28_TEXT
     else:
-        set_field(
-            result,
-            "passport.surname",
-            "WANG",
-            "OCR",
-            None,
-            "姓: 王 (WANG)",
-        )
-        set_field(
-            result,
-            "passport.given_names",
-            "WEI",
-            "OCR",
-            None,
-            "名: 伟 (WEI)",
-        )
-        set_field(
-            result,
-            "passport.date_of_birth",
-            "1990-01-01",
-            "OCR",
-            None,
-            "出生日期：1991年01月01日",
-        )
-        set_field(
-            result,
-            "passport.date_of_expiration",
-            "2012-04-15",
-            "OCR",
-            None,
-            "有效期至：2012年04月15日",
-        )
-        dom_readback["passport.surname"] = "WANG"
-        dom_readback["passport.given_names"] = "WEI"
-        dom_readback["passport.date_of_birth"] = "1990-01-01"
-        dom_readback["passport.date_of_expiration"] = "2012-04-15"
         passport_text = CHINESE_PASSPORT_TEXT
         g28_text = CHINESE_G28_TEXT
 
@@ -179,20 +184,28 @@ def _build_result(language: str) -> tuple[ExtractionResult, dict]:
 
 def _write_run(run_dir: Path, payload: dict) -> None:
     run_dir.mkdir(parents=True, exist_ok=True)
-    (run_dir / "autofill_summary.json").write_text(
-        json.dumps(payload["autofill_report"], indent=2)
+    (run_dir / "autofill_summary.json").write_bytes(
+        orjson.dumps(payload["autofill_report"], option=orjson.OPT_INDENT_2)
     )
 
-    _render_text_artifacts(
-        payload["passport_text"],
-        run_dir / "passport_demo.png",
-        run_dir / "passport_demo.pdf",
-    )
-    _render_text_artifacts(
-        payload["g28_text"],
-        run_dir / "g28_demo.png",
-        run_dir / "g28_demo.pdf",
-    )
+    # The two renders share no state and Pillow releases the GIL while encoding.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(
+                _render_text_artifacts,
+                payload["passport_text"],
+                run_dir / "passport_demo.png",
+                run_dir / "passport_demo.pdf",
+            ),
+            executor.submit(
+                _render_text_artifacts,
+                payload["g28_text"],
+                run_dir / "g28_demo.png",
+                run_dir / "g28_demo.pdf",
+            ),
+        ]
+    for future in futures:
+        future.result()
 
 
 def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
@@ -211,28 +224,37 @@ def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     return ImageFont.load_default()
 
 
-def _render_text_artifacts(text: str, png_path: Path, pdf_path: Path) -> None:
-    width = 1200
-    margin = 60
-    font_size = 28
-    line_height = 40
-    font = _load_font(font_size)
+@functools.cache
+def _wrap_demo_text(text: str, width: int = 42) -> tuple[str, ...]:
+    # Demo texts are module constants, so each layout is only wrapped once per process.
     lines: list[str] = []
     for raw in text.splitlines():
         raw = raw.rstrip()
         if not raw:
             lines.append("")
             continue
-        wrap_width = 42
-        lines.extend(textwrap.wrap(raw, width=wrap_width) or [""])
+        lines.extend(textwrap.wrap(raw, width=width) or [""])
+    return tuple(lines)
+
+
+def _render_text_artifacts(text: str, png_path: Path, pdf_path: Path) -> None:
+    width = 1200
+    margin = 60
+    font_size = 28
+    line_height = 40
+    font = _load_font(font_size)
+    lines = _wrap_demo_text(text)
     height = max(600, margin * 2 + line_height * len(lines))
-    image = Image.new("RGB", (width, height), color=(255, 255, 255))
+    # Black-on-white text only needs a single 8-bit grayscale band.
+    image = Image.new("L", (width, height), color=255)
     draw = ImageDraw.Draw(image)
     y = margin
     for line in lines:
-        draw.text((margin, y), line, fill=(20, 20, 20), font=font)
+        draw.text((margin, y), line, fill=20, font=font)
         y += line_height
-    image.save(png_path)
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    png_path.write_bytes(buffer.getvalue())
     image.save(pdf_path, "PDF", resolution=150.0)
 
 
@@ -250,7 +272,7 @@ def main() -> None:
     run_id = args.run_id or f"demo_bad_{args.language}"
     run_dir = DATASETS_DIR / run_id
     _write_run(run_dir, payload)
-    (run_dir / "extracted.json").write_text(json.dumps(result.model_dump(), indent=2))
+    (run_dir / "extracted.json").write_text(result.model_dump_json(indent=2))
 
     print(f"Created demo dataset in {run_dir}")
     print("Run /post_autofill_validate with run_id to generate validation output.")
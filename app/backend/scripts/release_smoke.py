@@ -1,31 +1,35 @@
 from __future__ import annotations
 
+import functools
 import os
 import tempfile
 from io import BytesIO
 from pathlib import Path
 from typing import Dict
 
-import requests
+import orjson
 from fastapi.testclient import TestClient
 from PIL import Image, ImageDraw, ImageFont
 
+from backend.download import fetch_to
 from backend.main import app
 
 SAMPLE_G28_URL = "https://alma-public-assets.s3.us-west-2.amazonaws.com/interview/Example_G-28.pdf"
 FIXTURES_DIR = Path(__file__).resolve().parents[1] / "tests" / "fixtures"
 LOCAL_G28_PATH = FIXTURES_DIR / "Example_G-28.pdf"
 LOCAL_FORM_PATH = FIXTURES_DIR / "form.html"
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client() -> TestClient:
+    return TestClient(app)
 
 
 def _ensure_g28_path(tmp_dir: Path) -> Path:
     if LOCAL_G28_PATH.exists():
         return LOCAL_G28_PATH
-    target = tmp_dir / "Example_G-28.pdf"
-    resp = requests.get(SAMPLE_G28_URL, timeout=30)
-    resp.raise_for_status()
-    target.write_bytes(resp.content)
-    return target
+    return fetch_to(SAMPLE_G28_URL, tmp_dir / "Example_G-28.pdf")
 
 
 def _form_fixture_url() -> str:
@@ -35,17 +39,15 @@ def _form_fixture_url() -> str:
 
 
 def _build_passport_image() -> BytesIO:
-    img = Image.new("RGB", (1200, 600), "white")
+    img = Image.new("L", (1200, 600), 255)
     draw = ImageDraw.Draw(img)
     font = ImageFont.load_default()
     mrz_lines = [
         "P<UTOERIKSSON<<ANNA<MARIA<<<<<<<<<<<<<<<<<<<",
         "L898902C36UTO7408122F1204159ZE184226B<<<<<10",
     ]
-    y = 450
-    for line in mrz_lines:
-        draw.text((50, y), line, font=font, fill="black")
-        y += 20
+    # The default font is 10px tall, so spacing=10 keeps the original 20px line pitch.
+    draw.multiline_text((50, 450), "\n".join(mrz_lines), font=font, spacing=10, fill=0)
     buffer = BytesIO()
     img.save(buffer, format="PNG")
     buffer.seek(0)
@@ -54,87 +56,86 @@ def _build_passport_image() -> BytesIO:
 
 def _assert_schema(payload: Dict) -> None:
     assert set(payload.keys()) == {"passport", "g28", "meta"}
-    assert "attorney" in payload["g28"]
-    assert "client" in payload["g28"]
-    assert "sources" in payload["meta"]
-    assert "confidence" in payload["meta"]
-    assert "status" in payload["meta"]
-    assert "evidence" in payload["meta"]
-    assert "suggestions" in payload["meta"]
-    assert "warnings" in payload["meta"]
-
-    for path, value in _collect_non_null_fields(payload).items():
-        assert path in payload["meta"]["sources"]
-        conf = payload["meta"]["confidence"].get(path)
+    g28 = payload["g28"]
+    meta = payload["meta"]
+    assert "attorney" in g28
+    assert "client" in g28
+    assert "sources" in meta
+    assert "confidence" in meta
+    assert "status" in meta
+    assert "evidence" in meta
+    assert "suggestions" in meta
+    assert "warnings" in meta
+
+    sources = meta["sources"]
+    confidence = meta["confidence"]
+    for path in _collect_non_null_fields(payload):
+        assert path in sources
+        conf = confidence.get(path)
         assert conf is not None
         assert 0.0 <= conf <= 1.0
 
 
 def _collect_non_null_fields(payload: Dict, prefix: str = "") -> Dict:
     out: Dict[str, object] = {}
-    for key, value in payload.items():
-        if key == "meta":
-            continue
-        path = f"{prefix}.{key}" if prefix else key
-        if isinstance(value, dict):
-            out.update(_collect_non_null_fields(value, path))
-        else:
-            if value is not None:
+    stack = [(prefix, payload)]
+    while stack:
+        node_prefix, node = stack.pop()
+        for key, value in node.items():
+            if key == "meta":
+                continue
+            path = f"{node_prefix}.{key}" if node_prefix else key
+            if isinstance(value, dict):
+                stack.append((path, value))
+            elif value is not None:
                 out[path] = value
     return out
 
 
-def _merge_defaults(payload: Dict) -> Dict:
-    merged = {
-        "passport": dict(payload.get("passport") or {}),
-        "g28": dict(payload.get("g28") or {}),
-        "meta": dict(payload.get("meta") or {}),
-    }
-    merged_passport = merged["passport"]
-    merged_g28 = merged["g28"]
-    merged_attorney = dict(merged_g28.get("attorney") or {})
-    merged_address = dict(merged_attorney.get("address") or {})
-
-    defaults_passport = {
-        "surname": "DOE",
-        "given_names": "JANE",
-        "date_of_birth": "1990-01-01",
-        "date_of_expiration": "2030-01-01",
-        "sex": "F",
-    }
-    defaults_g28 = {
-        "family_name": "Doe",
-        "given_name": "Jane",
-        "middle_name": "Q",
-        "law_firm_name": "Doe Law",
-        "phone_daytime": "206-555-1212",
-        "phone_mobile": "206-555-3434",
-        "email": "jane@example.com",
-    }
-    defaults_address = {
-        "street": "123 Main St",
-        "unit": "Suite 200",
-        "city": "Seattle",
-        "state": "WA",
-        "zip": "98101",
-        "country": "USA",
-    }
+PASSPORT_DEFAULTS = {
+    "surname": "DOE",
+    "given_names": "JANE",
+    "date_of_birth": "1990-01-01",
+    "date_of_expiration": "2030-01-01",
+    "sex": "F",
+}
+ATTORNEY_DEFAULTS = {
+    "family_name": "Doe",
+    "given_name": "Jane",
+    "middle_name": "Q",
+    "law_firm_name": "Doe Law",
+    "phone_daytime": "206-555-1212",
+    "phone_mobile": "206-555-3434",
+    "email": "jane@example.com",
+}
+ADDRESS_DEFAULTS = {
+    "street": "123 Main St",
+    "unit": "Suite 200",
+    "city": "Seattle",
+    "state": "WA",
+    "zip": "98101",
+    "country": "USA",
+}
+
+
+def _fill_missing(target: Dict, defaults: Dict) -> Dict:
+    for key, value in defaults.items():
+        if target.get(key) in (None, ""):
+            target[key] = value
+    return target
 
-    for key, value in defaults_passport.items():
-        if merged_passport.get(key) in (None, ""):
-            merged_passport[key] = value
-    for key, value in defaults_g28.items():
-        if merged_attorney.get(key) in (None, ""):
-            merged_attorney[key] = value
-    for key, value in defaults_address.items():
-        if merged_address.get(key) in (None, ""):
-            merged_address[key] = value
 
-    merged_attorney["address"] = merged_address
-    merged_g28["attorney"] = merged_attorney
-    merged["passport"] = merged_passport
-    merged["g28"] = merged_g28
-    return merged
+def _merge_defaults(payload: Dict) -> Dict:
+    # One shallow copy per nested level; defaults are filled in place on those copies.
+    g28 = {**(payload.get("g28") or {})}
+    attorney = g28["attorney"] = {**(g28.get("attorney") or {})}
+    attorney["address"] = _fill_missing({**(attorney.get("address") or {})}, ADDRESS_DEFAULTS)
+    _fill_missing(attorney, ATTORNEY_DEFAULTS)
+    return {
+        "passport": _fill_missing({**(payload.get("passport") or {})}, PASSPORT_DEFAULTS),
+        "g28": g28,
+        "meta": {**(payload.get("meta") or {})},
+    }
 
 
 def run_release_smoke() -> Dict:
@@ -144,7 +145,7 @@ def run_release_smoke() -> Dict:
     form_url = _form_fixture_url()
     os.environ["ALMA_FORM_URL"] = form_url
 
-    client = TestClient(app)
+    client = _get_client()
     with g28_path.open("rb") as g28_file:
         extract_resp = client.post(
             "/extract",
@@ -154,38 +155,44 @@ def run_release_smoke() -> Dict:
             },
         )
     assert extract_resp.status_code == 200
-    extract_payload = extract_resp.json()
+    extract_payload = orjson.loads(extract_resp.content)
     _assert_schema(extract_payload["result"])
 
     payload = _merge_defaults(extract_payload["result"])
     payload["run_id"] = extract_payload["run_id"]
-    review_resp = client.post("/review", json=payload)
+    # The same merged payload is posted to /review and both /autofill calls; encode it once.
+    payload_body = orjson.dumps(payload)
+    review_resp = client.post("/review", content=payload_body, headers=JSON_HEADERS)
     assert review_resp.status_code == 200
-    review_payload = review_resp.json()
+    review_payload = orjson.loads(review_resp.content)
     review_summary = (review_payload.get("review") or {}).get("summary") or {}
     assert review_summary.get("ready_for_autofill") is True
 
     approve_resp = client.post(
         "/approve_canonical",
-        json={
-            "run_id": extract_payload["run_id"],
-            "result": review_payload.get("result"),
-            "review_summary": review_summary,
-        },
+        content=orjson.dumps(
+            {
+                "run_id": extract_payload["run_id"],
+                "result": review_payload.get("result"),
+                "review_summary": review_summary,
+            }
+        ),
+        headers=JSON_HEADERS,
     )
     assert approve_resp.status_code == 200
 
-    autofill_resp_1 = client.post("/autofill", json=payload)
+    autofill_resp_1 = client.post("/autofill", content=payload_body, headers=JSON_HEADERS)
     assert autofill_resp_1.status_code == 200
-    summary_1 = autofill_resp_1.json()["summary"]
+    autofill_payload_1 = orjson.loads(autofill_resp_1.content)
+    summary_1 = autofill_payload_1["summary"]
     trace_1 = Path(summary_1["trace_path"])
     assert trace_1.exists()
     assert len(summary_1.get("attempted_fields", [])) >= 8
     assert form_url in summary_1["final_url"]
 
-    autofill_resp_2 = client.post("/autofill", json=payload)
+    autofill_resp_2 = client.post("/autofill", content=payload_body, headers=JSON_HEADERS)
     assert autofill_resp_2.status_code == 200
-    summary_2 = autofill_resp_2.json()["summary"]
+    summary_2 = orjson.loads(autofill_resp_2.content)["summary"]
 
     assert summary_1.get("attempted_fields", []) == summary_2.get("attempted_fields", [])
     assert summary_1["filled_fields"] == summary_2["filled_fields"]
@@ -194,7 +201,7 @@ def run_release_smoke() -> Dict:
 
     return {
         "extract_run_id": extract_payload["run_id"],
-        "autofill_run_id": autofill_resp_1.json()["run_id"],
+        "autofill_run_id": autofill_payload_1["run_id"],
         "form_url": form_url,
     }
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from backend.automation.fill_form import fill_form
@@ -93,13 +94,18 @@ def main() -> None:
     args = parser.parse_args()
 
     fixture_url = args.form_url or _fixture_form_uri()
-    run_id = _run_once(args.passport, args.g28, fixture_url)
-    print(f"Fixture run complete: {run_id}")
-
-    if args.smoke:
-        real_url = resolve_form_url(None)
-        smoke_run_id = _run_once(args.passport, args.g28, real_url)
-        print(f"Smoke run complete: {smoke_run_id}")
+    if not args.smoke:
+        run_id = _run_once(args.passport, args.g28, fixture_url)
+        print(f"Fixture run complete: {run_id}")
+        return
+
+    # Each run gets its own run dir and browser (a pooled worker when headless), so the passes overlap.
+    real_url = resolve_form_url(None)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fixture_future = executor.submit(_run_once, args.passport, args.g28, fixture_url)
+        smoke_future = executor.submit(_run_once, args.passport, args.g28, real_url)
+        print(f"Fixture run complete: {fixture_future.result()}")
+        print(f"Smoke run complete: {smoke_future.result()}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def seed_run_file(run_dir: Path, relpath: str, data: bytes) -> Path:
+    """Write ``data`` to ``run_dir/relpath``, creating parent directories in one call."""
+    path = os.path.join(run_dir, relpath)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return Path(path)
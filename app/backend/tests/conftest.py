@@ -1,18 +1,23 @@
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 import pytest
-import requests
 
 ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from backend.download import fetch_to  # noqa: E402
+
 
 SAMPLE_G28_URL = "https://alma-public-assets.s3.us-west-2.amazonaws.com/interview/Example_G-28.pdf"
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 LOCAL_G28_PATH = FIXTURES_DIR / "Example_G-28.pdf"
 LOCAL_FORM_PATH = FIXTURES_DIR / "form.html"
+CHECKBOX_DATE_FORM_PATH = FIXTURES_DIR / "checkbox_date_fixture.html"
 SYNTHETIC_PASSPORT_PATH = FIXTURES_DIR / "synthetic_passport_mrz.png"
 SYNTHETIC_PASSPORT_JPG_PATH = FIXTURES_DIR / "synthetic_passport_mrz.jpg"
 SYNTHETIC_PASSPORT_REALISTIC_PATH = FIXTURES_DIR / "synthetic_passport_mrz_realistic.png"
@@ -21,6 +26,79 @@ SYNTHETIC_G28_PATH = FIXTURES_DIR / "synthetic_g28_text.png"
 SYNTHETIC_G28_BLUR_PATH = FIXTURES_DIR / "synthetic_g28_text_blurred.png"
 
 
+SHM_DIR = Path("/dev/shm")
+TMPFS_ENV = "DOC_EXTRACTOR_TMPFS"
+TMPFS_MIN_FREE_BYTES = 512 * 1024 * 1024
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Opt-in: run tmp_path on tmpfs in a private per-session dir. An explicit --basetemp (or an
+    # xdist worker's, handed down by the controller) wins, and small /dev/shm mounts are skipped.
+    if config.option.basetemp is not None or os.getenv(TMPFS_ENV, "").lower() not in {"1", "true", "yes"}:
+        return
+    if sys.platform != "linux" or not SHM_DIR.is_dir():
+        return
+    if shutil.disk_usage(SHM_DIR).free < TMPFS_MIN_FREE_BYTES:
+        return
+    config.option.basetemp = config._doc_extractor_tmpfs = tempfile.mkdtemp(dir=SHM_DIR, prefix="doc-extractor-pytest-")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    # tmpfs is RAM; drop the session dir instead of keeping pytest's numbered retention.
+    tmpfs_dir = getattr(config, "_doc_extractor_tmpfs", None)
+    if tmpfs_dir:
+        shutil.rmtree(tmpfs_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _browser_pool_teardown():
+    # Browsers launch lazily on the first autofill test; close them once the session ends.
+    yield
+    from backend.automation import browser_pool
+
+    browser_pool.shutdown()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_validators():
+    # Import the rule modules and walk the registry once so the first validation test doesn't pay for it.
+    from backend.pipeline.validate import validate_and_annotate
+    from backend.schemas import ExtractionResult
+
+    validate_and_annotate(ExtractionResult(), use_llm=False)
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    from backend.main import app
+
+    with TestClient(app) as test_client:
+        # Build the OpenAPI schema up front so the first endpoint test doesn't pay for it.
+        test_client.get("/openapi.json")
+        yield test_client
+
+
+FAKE_TRANSLATIONS = {"Hola mundo": "Hello world"}
+
+
+def _fake_translate(text: str):
+    if text not in FAKE_TRANSLATIONS:
+        return None, f"No fake translation for {text!r}"
+    return FAKE_TRANSLATIONS[text], None
+
+
+@pytest.fixture
+def fake_translate():
+    # Scoped to the requesting test so no other test ever sees the fake translator.
+    from backend import main
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(main, "translate_text", _fake_translate)
+        yield _fake_translate
+
+
 @pytest.fixture(scope="session")
 def sample_g28_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     if LOCAL_G28_PATH.exists():
@@ -29,11 +107,9 @@ def sample_g28_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     target_dir = tmp_path_factory.mktemp("fixtures")
     target_path = target_dir / "Example_G-28.pdf"
     try:
-        resp = requests.get(SAMPLE_G28_URL, timeout=30)
-        resp.raise_for_status()
+        fetch_to(SAMPLE_G28_URL, target_path)
     except Exception as exc:  # noqa: BLE001
         pytest.fail(f"Unable to locate sample G-28 PDF and download failed: {exc}")
-    target_path.write_bytes(resp.content)
     return target_path
 
 
@@ -44,6 +120,13 @@ def form_fixture_url() -> str:
     return LOCAL_FORM_PATH.resolve().as_uri()
 
 
+@pytest.fixture(scope="session")
+def checkbox_date_fixture_url() -> str:
+    if not CHECKBOX_DATE_FORM_PATH.exists():
+        pytest.fail(f"Checkbox/date form fixture missing at {CHECKBOX_DATE_FORM_PATH}")
+    return CHECKBOX_DATE_FORM_PATH.resolve().as_uri()
+
+
 @pytest.fixture(scope="session")
 def synthetic_passport_path() -> Path:
     if not SYNTHETIC_PASSPORT_PATH.exists():
@@ -84,3 +167,37 @@ def synthetic_g28_blur_path() -> Path:
     if not SYNTHETIC_G28_BLUR_PATH.exists():
         pytest.fail(f"Synthetic blurred G-28 fixture missing at {SYNTHETIC_G28_BLUR_PATH}")
     return SYNTHETIC_G28_BLUR_PATH
+
+
+@pytest.fixture(scope="session")
+def realistic_passport_extraction(realistic_passport_path: Path):
+    from backend.main import extract_documents
+
+    return extract_documents(passport_path=realistic_passport_path, g28_path=None)
+
+
+@pytest.fixture(scope="session")
+def sample_g28_extraction(sample_g28_path: Path):
+    from backend.main import extract_documents
+
+    return extract_documents(passport_path=None, g28_path=sample_g28_path)
+
+
+@pytest.fixture(scope="session")
+def extracted_payload(realistic_passport_path: Path, sample_g28_path: Path) -> dict:
+    from backend.main import extract_documents
+
+    result = extract_documents(passport_path=realistic_passport_path, g28_path=sample_g28_path)
+    return result.model_dump()
+
+
+@pytest.fixture(scope="session")
+def autofill_summary(
+    extracted_payload: dict,
+    form_fixture_url: str,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> dict:
+    from backend.automation.fill_form import fill_form
+
+    run_dir = tmp_path_factory.mktemp("run_e2e")
+    return fill_form(extracted_payload, run_dir, form_url=form_fixture_url, headless=True, keep_open_ms=0)
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
 import re
-from pathlib import Path
 
-from backend.automation.fill_form import fill_form
 from backend.field_registry import iter_autofill_fields
-from backend.main import extract_documents
 from backend.pipeline.normalize import normalize_date
 
 
-def _get_value(payload: dict, path: str):
-    parts = path.split(".")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _get_value(payload: dict, parts: tuple[str, ...]):
     value: object = payload
     for part in parts:
         if not isinstance(value, dict) or part not in value:
@@ -20,7 +19,7 @@ def _get_value(payload: dict, path: str):
 
 
 def _normalize_compare(value: str) -> str:
-    return re.sub(r"\s+", "", str(value).strip()).lower()
+    return WHITESPACE_RE.sub("", str(value).strip()).lower()
 
 
 def _assert_value_matches(expected: str, actual: str) -> None:
@@ -29,24 +28,14 @@ def _assert_value_matches(expected: str, actual: str) -> None:
     assert exp_norm == act_norm
 
 
-def test_autofill_coverage_on_fixtures(
-    tmp_path: Path,
-    sample_g28_path: Path,
-    realistic_passport_path: Path,
-    form_fixture_url: str,
-) -> None:
-    result = extract_documents(
-        passport_path=realistic_passport_path,
-        g28_path=sample_g28_path,
-    )
-    payload = result.model_dump()
-    run_dir = tmp_path / "run_e2e"
-    summary = fill_form(payload, run_dir, form_url=form_fixture_url, headless=True, keep_open_ms=0)
+def test_autofill_coverage_on_fixtures(extracted_payload: dict, autofill_summary: dict) -> None:
+    payload = extracted_payload
+    summary = autofill_summary
 
     field_results = summary.get("field_results") or {}
-    for spec in iter_autofill_fields():
-        path = spec.key
-        value = _get_value(payload, path)
+    path_parts = {spec.key: tuple(spec.key.split(".")) for spec in iter_autofill_fields()}
+    for path, parts in path_parts.items():
+        value = _get_value(payload, parts)
         if value is None or str(value).strip() == "":
             continue
         entry = field_results.get(path)
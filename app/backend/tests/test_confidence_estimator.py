@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from backend.pipeline.confidence import estimate_confidence, set_field
+from backend.pipeline.confidence import base_confidence_for_source, estimate_confidence, set_field
 from backend.schemas import ExtractionResult
 
 
@@ -21,3 +21,15 @@ def test_set_field_uses_estimate_when_confidence_missing() -> None:
     conf = result.meta.confidence["passport.passport_number"]
     assert conf >= 0.8
     assert conf <= 0.99
+
+
+def test_base_confidence_lookup_by_source() -> None:
+    assert base_confidence_for_source("MRZ") == 0.95
+    assert base_confidence_for_source("mrz") == 0.95
+    assert base_confidence_for_source("USER") == 1.0
+    assert base_confidence_for_source("MERGE") == base_confidence_for_source("PASSPORT") == 0.85
+    assert base_confidence_for_source("OCR") == 0.75
+    assert base_confidence_for_source("OCR", match_quality="fuzzy") == 0.6
+    # Fuzzy matching only lowers the OCR baseline.
+    assert base_confidence_for_source("MRZ", match_quality="fuzzy") == 0.95
+    assert base_confidence_for_source("SOMETHING_ELSE") == 0.7
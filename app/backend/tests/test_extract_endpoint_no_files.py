@@ -1,11 +1,8 @@
-from fastapi.testclient import TestClient
-
 from backend import main
 
 
-def test_extract_endpoint_no_files(tmp_path, monkeypatch) -> None:
+def test_extract_endpoint_no_files(client, tmp_path, monkeypatch) -> None:
     monkeypatch.setattr(main, "RUNS_DIR", tmp_path)
-    client = TestClient(main.app)
     response = client.post("/extract")
     assert response.status_code == 200
     payload = response.json()
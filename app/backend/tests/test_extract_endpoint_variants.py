@@ -2,13 +2,10 @@ from __future__ import annotations
 
 from io import BytesIO
 
-from fastapi.testclient import TestClient
+import pytest
 from PIL import Image, ImageDraw, ImageFont
 
-from backend.main import app
-
-
-client = TestClient(app)
+_FONT = ImageFont.load_default()
 
 
 def _assert_schema(payload: dict) -> None:
@@ -22,48 +19,47 @@ def _assert_schema(payload: dict) -> None:
     assert "presence" in payload["meta"]
     assert "warnings" in payload["meta"]
 
-    for path, value in _collect_non_null_fields(payload).items():
-        assert path in payload["meta"]["sources"]
-        conf = payload["meta"]["confidence"].get(path)
+    sources = payload["meta"]["sources"]
+    confidence = payload["meta"]["confidence"]
+    for path, _value in _iter_non_null(payload):
+        assert path in sources
+        conf = confidence.get(path)
         assert conf is not None
         assert 0.0 <= conf <= 1.0
 
 
-def _collect_non_null_fields(payload: dict, prefix: str = "") -> dict:
-    out = {}
-    for key, value in payload.items():
-        if key == "meta":
-            continue
-        path = f"{prefix}.{key}" if prefix else key
-        if isinstance(value, dict):
-            out.update(_collect_non_null_fields(value, path))
-        else:
-            if value is not None:
-                out[path] = value
-    return out
+def _iter_non_null(payload: dict, prefix: str = ""):
+    stack = [(prefix, payload)]
+    while stack:
+        node_prefix, node = stack.pop()
+        for key, value in node.items():
+            if key == "meta":
+                continue
+            path = f"{node_prefix}.{key}" if node_prefix else key
+            if isinstance(value, dict):
+                stack.append((path, value))
+            elif value is not None:
+                yield path, value
 
 
-def _build_passport_image() -> BytesIO:
+@pytest.fixture(scope="session")
+def passport_png_bytes() -> bytes:
     img = Image.new("RGB", (1200, 600), "white")
     draw = ImageDraw.Draw(img)
-    font = ImageFont.load_default()
     mrz_lines = [
         "P<UTOERIKSSON<<ANNA<MARIA<<<<<<<<<<<<<<<<<<<",
         "L898902C36UTO7408122F1204159ZE184226B<<<<<10",
     ]
     y = 450
     for line in mrz_lines:
-        draw.text((50, y), line, font=font, fill="black")
+        draw.text((50, y), line, font=_FONT, fill="black")
         y += 20
     buffer = BytesIO()
     img.save(buffer, format="PNG")
-    buffer.seek(0)
-    return buffer
-
+    return buffer.getvalue()
 
-def test_extract_endpoint_variants(sample_g28_path) -> None:
-    passport_image = _build_passport_image()
 
+def test_extract_endpoint_variants(client, sample_g28_path, passport_png_bytes) -> None:
     # only g28
     with sample_g28_path.open("rb") as g28_file:
         response = client.post("/extract", files={"g28": ("g28.pdf", g28_file, "application/pdf")})
@@ -74,7 +70,7 @@ def test_extract_endpoint_variants(sample_g28_path) -> None:
     # only passport
     response = client.post(
         "/extract",
-        files={"passport": ("passport.png", passport_image, "image/png")},
+        files={"passport": ("passport.png", BytesIO(passport_png_bytes), "image/png")},
     )
     assert response.status_code == 200
     data = response.json()
@@ -90,12 +86,11 @@ def test_extract_endpoint_variants(sample_g28_path) -> None:
         )
 
     # both
-    passport_image.seek(0)
     with sample_g28_path.open("rb") as g28_file:
         response = client.post(
             "/extract",
             files={
-                "passport": ("passport.png", passport_image, "image/png"),
+                "passport": ("passport.png", BytesIO(passport_png_bytes), "image/png"),
                 "g28": ("g28.pdf", g28_file, "application/pdf"),
             },
         )
@@ -104,7 +99,7 @@ def test_extract_endpoint_variants(sample_g28_path) -> None:
     _assert_schema(data["result"])
 
 
-def test_extract_endpoint_jpg(synthetic_passport_jpg_path) -> None:
+def test_extract_endpoint_jpg(client, synthetic_passport_jpg_path) -> None:
     with synthetic_passport_jpg_path.open("rb") as passport_file:
         response = client.post(
             "/extract",
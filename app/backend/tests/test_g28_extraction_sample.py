@@ -1,13 +1,9 @@
 from __future__ import annotations
 
-from backend.main import extract_documents
 
-
-def test_g28_extraction_sample(sample_g28_path) -> None:
-    result = extract_documents(passport_path=None, g28_path=sample_g28_path)
-
-    attorney = result.g28.attorney
-    client = result.g28.client
+def test_g28_extraction_sample(sample_g28_extraction) -> None:
+    attorney = sample_g28_extraction.g28.attorney
+    client = sample_g28_extraction.g28.client
 
     assert attorney.family_name == "Messi"
     assert attorney.given_name == "Kaka"
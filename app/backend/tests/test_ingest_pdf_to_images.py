@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import os
+
+import pytest
+from PIL import Image
+
+from backend.pipeline import ingest
 from backend.pipeline.ingest import load_document, SUPPORTED_IMAGE_EXTS
 
 
@@ -14,3 +20,95 @@ def test_ingest_pdf_to_images(sample_g28_path) -> None:
 def test_supported_image_exts_include_jpg() -> None:
     assert ".jpg" in SUPPORTED_IMAGE_EXTS
     assert ".jpeg" in SUPPORTED_IMAGE_EXTS
+
+
+@pytest.fixture
+def ingest_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(ingest.INGEST_CACHE_ENV, "1")
+    monkeypatch.setattr(ingest, "INGEST_CACHE_DIR", tmp_path)
+    ingest._load_document_cached.cache_clear()
+    yield tmp_path
+    ingest._load_document_cached.cache_clear()
+
+
+def test_load_document_skips_cache_by_default(monkeypatch, synthetic_passport_path) -> None:
+    monkeypatch.delenv(ingest.INGEST_CACHE_ENV, raising=False)
+    ingest._load_document_cached.cache_clear()
+    load_document(synthetic_passport_path)
+    assert ingest._load_document_cached.cache_info().currsize == 0
+
+
+def test_load_document_returns_fresh_images_from_cache(ingest_cache, synthetic_passport_path) -> None:
+    first = load_document(synthetic_passport_path)[0]
+    second = load_document(synthetic_passport_path)[0]
+    assert ingest._load_document_cached.cache_info().hits == 1
+    assert first is not second
+    assert first.tobytes() == second.tobytes()
+
+
+def test_load_document_disk_cache(ingest_cache, monkeypatch, synthetic_passport_path) -> None:
+    pages = load_document(synthetic_passport_path)
+    assert [page.name for page in ingest_cache.glob("*/*")] == ["page-000.png"]
+
+    ingest._load_document_cached.cache_clear()
+    monkeypatch.setattr(ingest, "_load_document_uncached", lambda path: pytest.fail("expected a disk cache hit"))
+    cached = load_document(synthetic_passport_path)
+    assert cached[0].tobytes() == pages[0].tobytes()
+
+
+def test_load_document_disk_cache_evicts_least_recently_used(ingest_cache, monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(ingest, "INGEST_CACHE_DIR", tmp_path / "cache")
+    sources = []
+    for index, color in enumerate(("red", "green", "blue")):
+        source = tmp_path / f"scan-{index}.png"
+        Image.new("RGB", (64, 64), color).save(source)
+        sources.append(source)
+    load_document(sources[0])
+    entry_size = sum(page.stat().st_size for page in ingest.INGEST_CACHE_DIR.glob("*/*"))
+    monkeypatch.setattr(ingest, "INGEST_CACHE_MAX_BYTES", entry_size * 5 // 2)
+
+    load_document(sources[1])
+    oldest = ingest._disk_cache_path(sources[0])
+    os.utime(oldest, (0, 0))
+    load_document(sources[2])
+
+    assert not oldest.exists()
+    assert ingest._disk_cache_path(sources[1]).is_dir()
+    assert ingest._disk_cache_path(sources[2]).is_dir()
+
+
+def test_render_pdf_stops_retrying_broken_fastpdf2png(tmp_path, monkeypatch) -> None:
+    calls = []
+
+    class BrokenRenderer:
+        @staticmethod
+        def to_images(path, dpi):
+            calls.append(path)
+            raise RuntimeError("Conversion failed: fastpdf2png: /lib/x86_64-linux-gnu/libc.so.6: version `GLIBC_2.38' not found")
+
+    monkeypatch.setattr(ingest, "fastpdf2png", BrokenRenderer)
+    monkeypatch.setattr(ingest, "_FASTPDF2PNG_FAILED", False)
+    monkeypatch.setattr(ingest, "convert_from_path", lambda path, dpi: [Image.new("RGB", (8, 8))])
+    for name in ("a.pdf", "b.pdf"):
+        assert len(ingest._render_pdf(tmp_path / name)) == 1
+    assert len(calls) == 1
+
+
+def test_render_pdf_keeps_fastpdf2png_after_a_bad_document(tmp_path, monkeypatch) -> None:
+    calls = []
+
+    class PickyRenderer:
+        @staticmethod
+        def to_images(path, dpi):
+            calls.append(path)
+            if path.endswith("bad.pdf"):
+                raise RuntimeError("Conversion failed: encrypted document")
+            return [Image.new("RGB", (8, 8))]
+
+    monkeypatch.setattr(ingest, "fastpdf2png", PickyRenderer)
+    monkeypatch.setattr(ingest, "_FASTPDF2PNG_FAILED", False)
+    monkeypatch.setattr(ingest, "convert_from_path", lambda path, dpi: [Image.new("L", (4, 4))])
+    assert ingest._render_pdf(tmp_path / "bad.pdf")[0].mode == "L"
+    assert ingest._render_pdf(tmp_path / "good.pdf")[0].mode == "RGB"
+    assert len(calls) == 2
+    assert ingest._FASTPDF2PNG_FAILED is False
@@ -1,3 +1,4 @@
+from backend.pipeline import lang_detect
 from backend.pipeline.lang_detect import detect_language
 
 
@@ -22,3 +23,31 @@ def test_language_detection_non_english() -> None:
     result = detect_language(text)
     assert result.language != "en"
     assert result.confidence > 0.3
+
+
+def test_language_detection_uses_fasttext_model_when_available(monkeypatch) -> None:
+    class FakeModel:
+        def predict(self, text: str, k: int = 1):
+            assert "\n" not in text
+            return ("__label__es",), (0.97,)
+
+    lang_detect.clear_detection_cache()
+    monkeypatch.setattr(lang_detect, "_fasttext_model", lambda: FakeModel())
+    result = detect_language("Hola mundo.\nBuenos dias.")
+    assert result.language == "es"
+    assert result.confidence == 0.97
+
+
+def test_language_detection_caches_repeated_text(monkeypatch) -> None:
+    calls = {"count": 0}
+
+    def fake_detect(sample: str):
+        calls["count"] += 1
+        return lang_detect.LanguageDetectionResult(language="es", confidence=0.9)
+
+    lang_detect.clear_detection_cache()
+    monkeypatch.setattr(lang_detect, "_detect_sample", fake_detect)
+    first = detect_language("Texto repetido para la deteccion.")
+    second = detect_language("  Texto repetido para la deteccion.  ")
+    assert first == second
+    assert calls["count"] == 1
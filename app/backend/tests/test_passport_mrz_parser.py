@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from backend.pipeline.passport import parse_mrz_td3
+from backend.pipeline.passport import extract_mrz_lines, mrz_check, parse_mrz_td3
 
 
 def test_passport_mrz_parser() -> None:
@@ -17,3 +17,41 @@ def test_passport_mrz_parser() -> None:
     assert fields["date_of_birth"] == "1974-08-12"
     assert fields["date_of_expiration"] == "2012-04-15"
     assert fields["sex"] == "F"
+    assert fields["_mrz_checks"] == str(
+        {"passport_number": True, "date_of_birth": True, "date_of_expiration": True, "composite": True}
+    )
+
+
+def test_mrz_check_digits() -> None:
+    assert mrz_check(b"L898902C3") == 6
+    assert mrz_check(b"740812") == 2
+    assert mrz_check(b"120415") == 9
+    assert mrz_check(b"") == 0
+    assert mrz_check(b"<" * 60 + b"1") == 7
+    assert mrz_check(b"abc") == 7
+
+
+def test_extract_mrz_lines_prefers_td3_pair_over_trailing_noise() -> None:
+    text = "\n".join(
+        [
+            "PASSPORT",
+            "P<UTOERIKSSON<<ANNA<MARIA<<<<<<<<<<<<<<<<<<<",
+            "L898902C36UTO7408122F1204159ZE184226B<<<<<10",
+            "<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<",
+        ]
+    )
+    assert extract_mrz_lines(text) == [
+        "P<UTOERIKSSON<<ANNA<MARIA<<<<<<<<<<<<<<<<<<<",
+        "L898902C36UTO7408122F1204159ZE184226B<<<<<10",
+    ]
+
+
+def test_parse_mrz_td3_picks_checked_window_from_overlong_line2() -> None:
+    lines = [
+        "P<UTOERIKSSON<<ANNA<MARIA<<<<<<<<<<<<<<<<<<<",
+        "XX1L898902C36UTO7408122F1204159ZE184226B<<<<<10",
+    ]
+    result = parse_mrz_td3(lines)
+    assert result is not None
+    assert result.raw_lines[1] == "L898902C36UTO7408122F1204159ZE184226B<<<<<10"
+    assert result.fields["passport_number"] == "L898902C3"
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from pathlib import Path
-import textwrap
 
 from backend.automation.fill_form import fill_form
 
@@ -88,37 +87,7 @@ def test_autofill_prefers_user_values(tmp_path: Path, form_fixture_url: str) ->
     assert summary["field_results"]["g28.attorney.email"]["result"] == "PASS"
 
 
-def test_playwright_checkbox_and_date_inputs(tmp_path: Path) -> None:
-    html = textwrap.dedent(
-        """
-        <!doctype html>
-        <html lang="en">
-          <head>
-            <meta charset="UTF-8" />
-            <title>Checkbox + Date Fixture</title>
-          </head>
-          <body>
-            <form>
-              <div>
-                <label for="apt">Apt.</label>
-                <input id="apt" name="apt-type" type="checkbox" value="apt" />
-                <label for="ste">Ste.</label>
-                <input id="ste" name="apt-type" type="checkbox" value="ste" />
-                <label for="flr">Flr.</label>
-                <input id="flr" name="apt-type" type="checkbox" value="flr" />
-                <input id="apt-number" name="apt-number" type="text" />
-              </div>
-              <div>
-                <label for="passport-dob">5.a. Date of Birth</label>
-                <input id="passport-dob" name="passport-dob" type="date" />
-              </div>
-            </form>
-          </body>
-        </html>
-        """
-    ).strip()
-    form_path = tmp_path / "checkbox_date_fixture.html"
-    form_path.write_text(html)
+def test_playwright_checkbox_and_date_inputs(tmp_path: Path, checkbox_date_fixture_url: str) -> None:
     payload = {
         "g28": {
             "attorney": {
@@ -132,7 +101,7 @@ def test_playwright_checkbox_and_date_inputs(tmp_path: Path) -> None:
         },
     }
     run_dir = tmp_path / "run_checkbox"
-    summary = fill_form(payload, run_dir, form_url=form_path.resolve().as_uri(), headless=True, keep_open_ms=0)
+    summary = fill_form(payload, run_dir, form_url=checkbox_date_fixture_url, headless=True, keep_open_ms=0)
     unit_result = summary["field_results"]["g28.attorney.address.unit"]
     assert unit_result["result"] == "PASS"
     assert "ste" in (unit_result.get("selector_used") or "")
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from backend.pipeline.confidence import set_field
-from backend.pipeline.post_autofill import validate_post_autofill
+from backend.pipeline.post_autofill import _estimate_prompt_tokens, validate_post_autofill
 from backend.schemas import ExtractionResult
-from backend.field_registry import iter_fields
+from backend.field_registry import FIELD_KEYS
 
 
 def test_post_autofill_label_capture_red() -> None:
@@ -78,7 +78,7 @@ def test_llm_reviews_all_fields(monkeypatch) -> None:
         return [], None
 
     validate_post_autofill(result, autofill_report, "", "", use_llm=True, llm_client=llm_stub)
-    expected_fields = {spec.key for spec in iter_fields()}
+    expected_fields = set(FIELD_KEYS)
     assert called["count"] == len(expected_fields)
     assert set(called["fields"]) == expected_fields
 
@@ -97,3 +97,62 @@ def test_llm_smart_scope_skips_optional_empty(monkeypatch) -> None:
 
     validate_post_autofill(result, autofill_report, "", "", use_llm=True, llm_client=llm_stub)
     assert "g28.attorney.phone_daytime" not in called["fields"]
+
+
+def test_llm_batches_group_contexts_by_length(monkeypatch) -> None:
+    monkeypatch.setenv("LLM_VALIDATE_SCOPE", "all")
+    monkeypatch.setenv("LLM_VALIDATE_BATCH_SIZE", "4")
+    result = ExtractionResult()
+    set_field(result, "g28.attorney.email", "jane.doe@example.com", "OCR", None, "Email jane.doe@example.com")
+    set_field(result, "g28.attorney.given_name", "Jane", "OCR", None, "Jane")
+    autofill_report = {"filled_fields": [], "fill_failures": {}, "dom_readback": {}}
+    batches = []
+
+    def llm_stub(contexts):
+        batches.append([len(c["extracted_value"]) + len(c["dom_readback_value"]) + len(c["evidence"]) for c in contexts])
+        return [], None
+
+    validate_post_autofill(result, autofill_report, "", "", use_llm=True, llm_client=llm_stub)
+    assert all(len(batch) <= 4 for batch in batches)
+    assert sum(len(batch) for batch in batches) == len(FIELD_KEYS)
+    flattened = [size for batch in batches for size in batch]
+    assert flattened == sorted(flattened)
+
+
+def test_llm_batches_stay_within_token_budget(monkeypatch) -> None:
+    monkeypatch.setenv("LLM_VALIDATE_SCOPE", "all")
+    monkeypatch.setenv("LLM_VALIDATE_TARGET_TOKENS", "1500")
+    result = ExtractionResult()
+    set_field(result, "g28.attorney.email", "jane.doe@example.com", "OCR", None, "Email " * 200)
+    set_field(result, "g28.attorney.given_name", "Jane", "OCR", None, "Given name " * 150)
+    autofill_report = {"filled_fields": [], "fill_failures": {}, "dom_readback": {}}
+    batches = []
+
+    def llm_stub(contexts):
+        batches.append(contexts)
+        return [], None
+
+    validate_post_autofill(result, autofill_report, "", "", use_llm=True, llm_client=llm_stub)
+    assert len(batches) > 1
+    assert sum(len(batch) for batch in batches) == len(FIELD_KEYS)
+    for batch in batches:
+        assert len(batch) == 1 or _estimate_prompt_tokens(batch, "fast") <= 1500
+
+
+def test_llm_batches_keep_explicit_batch_size_over_token_budget(monkeypatch) -> None:
+    monkeypatch.setenv("LLM_VALIDATE_SCOPE", "all")
+    monkeypatch.setenv("LLM_VALIDATE_BATCH_SIZE", "4")
+    monkeypatch.setenv("LLM_VALIDATE_TARGET_TOKENS", "1500")
+    result = ExtractionResult()
+    set_field(result, "g28.attorney.email", "jane.doe@example.com", "OCR", None, "Email " * 200)
+    set_field(result, "g28.attorney.given_name", "Jane", "OCR", None, "Given name " * 150)
+    autofill_report = {"filled_fields": [], "fill_failures": {}, "dom_readback": {}}
+    batches = []
+
+    def llm_stub(contexts):
+        batches.append(len(contexts))
+        return [], None
+
+    validate_post_autofill(result, autofill_report, "", "", use_llm=True, llm_client=llm_stub)
+    full, remainder = divmod(len(FIELD_KEYS), 4)
+    assert batches == [4] * full + ([remainder] if remainder else [])
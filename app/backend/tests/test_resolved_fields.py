@@ -1,32 +1,21 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import orjson
 
-from fastapi.testclient import TestClient
-
-from backend.main import RUNS_DIR, app
+from backend.main import RUNS_DIR
 from backend.pipeline.confidence import set_field
 from backend.schemas import ExtractionResult, ResolvedField
 from backend.pipeline.post_autofill import validate_post_autofill
-from backend.field_registry import iter_fields
-
-
-client = TestClient(app)
-
-
-def _make_run_dir(run_id: str) -> Path:
-    run_dir = RUNS_DIR / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
-    return run_dir
+from backend.field_registry import FIELD_KEYS
+from backend.tests._seed import seed_run_file
 
 
-def test_save_field_edits_updates_resolved_fields() -> None:
+def test_save_field_edits_updates_resolved_fields(client) -> None:
     run_id = "test_run_save_edits"
-    run_dir = _make_run_dir(run_id)
+    run_dir = RUNS_DIR / run_id
     result = ExtractionResult()
     set_field(result, "g28.attorney.email", "old@example.com", "OCR", None, "old@example.com")
-    (run_dir / "extracted.json").write_text(json.dumps(result.model_dump()))
+    seed_run_file(run_dir, "extracted.json", result.model_dump_json().encode())
 
     resp = client.post(
         "/save_field_edits",
@@ -80,19 +69,19 @@ def test_locked_fields_not_sent_to_llm(monkeypatch) -> None:
         return [], None
 
     validate_post_autofill(result, autofill_report, "", "", use_llm=True, llm_client=llm_stub)
-    expected_fields = {spec.key for spec in iter_fields()}
+    expected_fields = set(FIELD_KEYS)
     expected_fields.discard("g28.attorney.email")
     assert called["count"] == len(expected_fields)
     assert set(called["fields"]) == expected_fields
     assert called["locked_seen"] is False
 
 
-def test_final_snapshot_written() -> None:
+def test_final_snapshot_written(client) -> None:
     run_id = "test_run_snapshot"
-    run_dir = _make_run_dir(run_id)
+    run_dir = RUNS_DIR / run_id
     result = ExtractionResult()
     set_field(result, "g28.attorney.email", "jane@example.com", "OCR", None, "jane@example.com")
-    (run_dir / "extracted.json").write_text(json.dumps(result.model_dump()))
+    seed_run_file(run_dir, "extracted.json", result.model_dump_json().encode())
 
     resp = client.post(
         "/post_autofill_validate",
@@ -107,7 +96,7 @@ def test_final_snapshot_written() -> None:
     coverage_path = run_dir / "e2e_coverage_report.json"
     assert snapshot_path.exists()
     assert coverage_path.exists()
-    snapshot = json.loads(snapshot_path.read_text())
+    snapshot = orjson.loads(snapshot_path.read_bytes())
     assert snapshot["run_id"] == run_id
     assert "resolved_fields" in snapshot
     assert "summary" in snapshot
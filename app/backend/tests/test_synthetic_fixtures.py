@@ -27,8 +27,9 @@ def test_passport_jpg_ocr_nonempty(synthetic_passport_jpg_path) -> None:
     assert passport_text.strip()
 
 
-def test_realistic_passport_mrz_extraction(realistic_passport_path) -> None:
-    result = extract_documents(passport_path=realistic_passport_path, g28_path=None)
+def test_realistic_passport_mrz_extraction(realistic_passport_extraction) -> None:
+    # validate_and_annotate writes into meta; keep the session-wide result untouched.
+    result = realistic_passport_extraction.model_copy(deep=True)
     assert result.passport.given_names == "Anna Maria"
     assert result.passport.surname == "Eriksson"
     assert result.passport.passport_number == "L898902C3"
@@ -1,19 +1,18 @@
-import json
-
-from fastapi.testclient import TestClient
+import orjson
 
 from backend import main
+from backend.tests._seed import seed_run_file
 
 
-def test_detect_language_creates_text_artifact(tmp_path, monkeypatch) -> None:
+def test_detect_language_creates_text_artifact(client, tmp_path, monkeypatch) -> None:
     monkeypatch.setattr(main, "RUNS_DIR", tmp_path)
-    run_dir = tmp_path / "lang_run"
-    (run_dir / "inputs").mkdir(parents=True)
-    (run_dir / "ocr_text.txt").write_text(
-        "This is a short English document used for language detection."
+    monkeypatch.setattr(
+        main,
+        "_load_ocr_text",
+        lambda run_dir: "This is a short English document used for language detection.",
     )
+    run_dir = tmp_path / "lang_run"
 
-    client = TestClient(main.app)
     response = client.post("/detect_language", data={"run_id": "lang_run", "doc_type": "g28"})
     assert response.status_code == 200
     payload = response.json()
@@ -23,27 +22,27 @@ def test_detect_language_creates_text_artifact(tmp_path, monkeypatch) -> None:
 
     artifact_path = run_dir / "doc_artifacts" / "g28" / "text_artifact.json"
     assert artifact_path.exists()
-    artifact = json.loads(artifact_path.read_text())
+    artifact = orjson.loads(artifact_path.read_bytes())
     assert artifact["doc_type"] == "g28"
     assert artifact["text"]["raw"].startswith("This is a short English document")
     assert artifact["text"]["active"] == "raw"
     assert artifact["language"]["detected"] == "en"
 
 
-def test_text_artifact_active_toggle_persists(tmp_path, monkeypatch) -> None:
+def test_text_artifact_active_toggle_persists(client, tmp_path, monkeypatch) -> None:
     monkeypatch.setattr(main, "RUNS_DIR", tmp_path)
     run_dir = tmp_path / "toggle_run"
-    (run_dir / "inputs").mkdir(parents=True)
-    (run_dir / "ocr_text.txt").write_text("Hola mundo")
-
-    def fake_translate(text: str):
-        return "Hello world", None
-
-    monkeypatch.setattr(main, "translate_text", fake_translate)
-
-    client = TestClient(main.app)
-    response = client.post("/translate", data={"run_id": "toggle_run", "doc_type": "passport"})
-    assert response.status_code == 200
+    artifact_path = seed_run_file(
+        run_dir,
+        "doc_artifacts/passport/text_artifact.json",
+        orjson.dumps(
+            {
+                "doc_type": "passport",
+                "language": {"detected": "es"},
+                "text": {"raw": "Hola mundo", "translated_en": "Hello world", "active": "translated_en"},
+            }
+        ),
+    )
 
     toggle_response = client.post(
         "/text_artifact/active",
@@ -53,6 +52,5 @@ def test_text_artifact_active_toggle_persists(tmp_path, monkeypatch) -> None:
     payload = toggle_response.json()
     assert payload["text_active"] == "raw"
 
-    artifact_path = run_dir / "doc_artifacts" / "passport" / "text_artifact.json"
-    artifact = json.loads(artifact_path.read_text())
+    artifact = orjson.loads(artifact_path.read_bytes())
     assert artifact["text"]["active"] == "raw"
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
-from fastapi.testclient import TestClient
+import orjson
 
-from backend.main import app
+from backend.pipeline.validate import validate_and_annotate
+from backend.schemas import ExtractionResult
 
-
-client = TestClient(app)
-
-
-def test_validate_endpoint() -> None:
-    payload = {
+_PAYLOAD = orjson.dumps(
+    {
         "passport": {
             "surname": "DOE",
             "given_names": "JANE",
@@ -35,13 +32,25 @@ def test_validate_endpoint() -> None:
             },
         },
     }
-    resp = client.post("/validate", json=payload)
+)
+
+
+def test_validate_endpoint(client) -> None:
+    resp = client.post("/validate", content=_PAYLOAD, headers={"content-type": "application/json"})
     assert resp.status_code == 200
-    body = resp.json()
+    body = orjson.loads(resp.content)
     report = body["report"]
     assert "result" in body
-    suggestions = body["result"]["meta"]["suggestions"]
-    assert "g28.attorney.address.street" in suggestions
+    assert "g28.attorney.address.street" in body["result"]["meta"]["suggestions"]
     assert "issues" in report
     assert "score" in report
     assert isinstance(report["issues"], list)
+
+
+def test_validate_flags_present_but_empty_fields() -> None:
+    # Same pipeline as the /validate handler, asserted on the models instead of the JSON body.
+    result = ExtractionResult.model_validate_json(_PAYLOAD)
+    report = validate_and_annotate(result)
+    assert result.meta.status["g28.attorney.address.street"] == "red"
+    assert result.meta.suggestions["g28.attorney.address.street"]
+    assert 0.0 <= report.score <= 1.0
@@ -1,8 +1,39 @@
 from __future__ import annotations
 
+from typing import Optional, Tuple
+
+import pytest
+
 from backend.pipeline.confidence import set_field
 from backend.pipeline.validate import validate_and_annotate
-from backend.schemas import ExtractionResult
+from backend.schemas import ExtractionResult, ValidationReport
+
+MRZ_BAD_PASSPORT_CHECK = (
+    "P<UTOERIKSSON<<ANNA<MARIA<<<<<<<<<<<<<<<<<<<\n"
+    "L898902C30UTO7408122F1204159ZE184226B<<<<<10"
+)
+
+# Independent probes: each touches its own field, so one validator pass covers them all.
+ANNOTATED_FIELDS = (
+    ("g28.attorney.email", "not-an-email", "OCR", "snippet"),
+    ("passport.date_of_birth", "1990-01-01", "MRZ", "MRZ"),
+    ("passport.surname", "DOE", "USER", "UI"),
+    ("g28.attorney.licensing_authority", "12345678", "OCR", "Licensing Authority"),
+    ("g28.attorney.address.state", "94301", "OCR", "State | 94301"),
+    ("g28.attorney.family_name", ")", "OCR", ")"),
+    ("passport.passport_number", "L898902C3", "MRZ", MRZ_BAD_PASSPORT_CHECK),
+)
+
+
+@pytest.fixture(scope="module")
+def annotated_result() -> Tuple[ExtractionResult, ValidationReport]:
+    result = ExtractionResult()
+    for path, value, source, evidence in ANNOTATED_FIELDS:
+        set_field(result, path, value, source, None, evidence)
+    result.meta.presence["passport.mrz"] = "present"
+    result.meta.presence["g28.attorney.phone_daytime"] = "absent"
+    report = validate_and_annotate(result)
+    return result, report
 
 
 def test_missing_label_present_marks_red_with_placeholder() -> None:
@@ -15,113 +46,61 @@ def test_missing_label_present_marks_red_with_placeholder() -> None:
     assert suggestions[0].reason is not None
 
 
-def test_missing_label_absent_marks_yellow() -> None:
-    result = ExtractionResult()
-    result.meta.presence["g28.attorney.phone_daytime"] = "absent"
-    validate_and_annotate(result)
+def test_missing_label_absent_marks_yellow(annotated_result) -> None:
+    result, _ = annotated_result
     assert result.meta.status["g28.attorney.phone_daytime"] == "yellow"
 
 
-def test_invalid_email_confidence_cap() -> None:
-    result = ExtractionResult()
-    set_field(result, "g28.attorney.email", "not-an-email", "OCR", None, "snippet")
-    validate_and_annotate(result)
+def test_invalid_email_confidence_cap(annotated_result) -> None:
+    result, _ = annotated_result
     assert result.meta.status["g28.attorney.email"] == "red"
     assert result.meta.confidence["g28.attorney.email"] <= 0.3
 
 
-def test_mrz_date_green_confidence() -> None:
-    result = ExtractionResult()
-    set_field(result, "passport.date_of_birth", "1990-01-01", "MRZ", None, "MRZ")
-    validate_and_annotate(result)
+def test_mrz_date_green_confidence(annotated_result) -> None:
+    result, _ = annotated_result
     assert result.meta.status["passport.date_of_birth"] == "green"
     assert result.meta.confidence["passport.date_of_birth"] >= 0.9
 
 
-def test_user_override_confidence() -> None:
-    result = ExtractionResult()
-    set_field(result, "passport.surname", "DOE", "USER", None, "UI")
-    validate_and_annotate(result)
+def test_user_override_confidence(annotated_result) -> None:
+    result, _ = annotated_result
     assert result.meta.sources["passport.surname"] == "USER"
     assert result.meta.confidence["passport.surname"] == 1.0
     assert result.meta.status["passport.surname"] == "green"
 
 
-def test_header_noise_marks_invalid() -> None:
-    result = ExtractionResult()
-    set_field(
-        result,
-        "g28.attorney.family_name",
-        "Notice of Entry of Appearance",
-        "OCR",
-        None,
-        "Notice of Entry of Appearance as Attorney or Accredited Representative",
-    )
-    report = validate_and_annotate(result)
-    assert result.meta.status["g28.attorney.family_name"] == "red"
-    assert any(issue.rule == "label_noise" for issue in report.issues)
-
-
-def test_label_noise_marks_invalid() -> None:
+@pytest.mark.parametrize(
+    ("field", "rule"),
+    [
+        pytest.param("g28.attorney.licensing_authority", "licensing_authority_numeric", id="licensing_authority_numeric"),
+        pytest.param("g28.attorney.address.state", "state_format", id="state_numeric"),
+        pytest.param("g28.attorney.family_name", None, id="punctuation_name"),
+        pytest.param("passport.passport_number", "mrz_check_digit", id="mrz_check_digit"),
+    ],
+)
+def test_invalid_value_marks_red(annotated_result, field: str, rule: Optional[str]) -> None:
+    result, report = annotated_result
+    assert result.meta.status[field] == "red"
+    if rule:
+        assert any(issue.field == field and issue.rule == rule for issue in report.issues)
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "evidence"),
+    [
+        pytest.param(
+            "g28.attorney.family_name",
+            "Notice of Entry of Appearance",
+            "Notice of Entry of Appearance as Attorney or Accredited Representative",
+            id="header_noise",
+        ),
+        pytest.param("g28.attorney.email", "Address (if any)", "Email Address (if any)", id="label_noise"),
+    ],
+)
+def test_label_noise_marks_red(field: str, value: str, evidence: str) -> None:
     result = ExtractionResult()
-    set_field(
-        result,
-        "g28.attorney.email",
-        "Address (if any)",
-        "OCR",
-        None,
-        "Email Address (if any)",
-    )
+    set_field(result, field, value, "OCR", None, evidence)
     report = validate_and_annotate(result)
-    assert result.meta.status["g28.attorney.email"] == "red"
+    assert result.meta.status[field] == "red"
     assert any(issue.rule == "label_noise" for issue in report.issues)
-
-
-def test_licensing_authority_numeric_invalid() -> None:
-    result = ExtractionResult()
-    set_field(
-        result,
-        "g28.attorney.licensing_authority",
-        "12345678",
-        "OCR",
-        None,
-        "Licensing Authority",
-    )
-    report = validate_and_annotate(result)
-    assert result.meta.status["g28.attorney.licensing_authority"] == "red"
-    assert any(issue.rule == "licensing_authority_numeric" for issue in report.issues)
-
-
-def test_state_numeric_marks_red() -> None:
-    result = ExtractionResult()
-    set_field(
-        result,
-        "g28.attorney.address.state",
-        "94301",
-        "OCR",
-        None,
-        "State | 94301",
-    )
-    report = validate_and_annotate(result)
-    assert result.meta.status["g28.attorney.address.state"] == "red"
-    assert any(issue.rule == "state_format" for issue in report.issues)
-
-
-def test_punctuation_name_marks_red() -> None:
-    result = ExtractionResult()
-    set_field(result, "g28.attorney.family_name", ")", "OCR", None, ")")
-    report = validate_and_annotate(result)
-    assert result.meta.status["g28.attorney.family_name"] == "red"
-
-
-def test_mrz_check_digit_failure_marks_red() -> None:
-    result = ExtractionResult()
-    mrz_lines = (
-        "P<UTOERIKSSON<<ANNA<MARIA<<<<<<<<<<<<<<<<<<<\n"
-        "L898902C30UTO7408122F1204159ZE184226B<<<<<10"
-    )
-    set_field(result, "passport.passport_number", "L898902C3", "MRZ", None, mrz_lines)
-    result.meta.presence["passport.mrz"] = "present"
-    report = validate_and_annotate(result)
-    assert result.meta.status["passport.passport_number"] == "red"
-    assert any(issue.rule == "mrz_check_digit" for issue in report.issues)